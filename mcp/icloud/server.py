@@ -7,15 +7,22 @@ Supports: Mail, Calendar, Reminders, Drive, Contacts, Find My
 
 import os
 import sys
+import re
 import json
+import base64
+import binascii
 import logging
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Any
 from mcp.server.fastmcp import FastMCP
 from pyicloud import PyiCloudService
 from pyicloud.exceptions import PyiCloudFailedLoginException, PyiCloudAPIResponseException
 import imaplib
 import email
+from email.parser import BytesParser
+from email.policy import default as default_policy
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import smtplib
@@ -362,16 +369,173 @@ def create_reminder_from_email(email_subject: str, email_from: str,
 # MAIL TOOLS (IMAP)
 # ============================================================================
 
+# One IMAP session is kept open across tool calls. It is only probed with
+# NOOP after sitting idle, since a live session needs no extra round trip.
+IMAP_NOOP_AFTER = 60  # seconds
+
+_imap: Optional[imaplib.IMAP4_SSL] = None
+_imap_last_used = 0.0
+_selected: Optional[tuple] = None  # (folder, uidvalidity) currently selected
+
+
 def get_imap_connection():
-    """Get IMAP connection to iCloud Mail"""
+    """Get IMAP connection to iCloud Mail, reusing the open session when alive"""
+    global _imap, _imap_last_used
+    now = time.monotonic()
+
+    if _imap is not None:
+        try:
+            if now - _imap_last_used >= IMAP_NOOP_AFTER:
+                _imap.noop()
+            _imap_last_used = now
+            return _imap
+        except (imaplib.IMAP4.error, OSError):
+            _discard_imap_connection()
+
     try:
         imap = imaplib.IMAP4_SSL('imap.mail.me.com')
         imap.login(ICLOUD_USERNAME, ICLOUD_PASSWORD)
-        return imap
     except Exception as e:
         logger.error(f"Failed to connect to iCloud Mail: {e}")
         raise
 
+    _imap, _imap_last_used = imap, now
+    return imap
+
+
+def _discard_imap_connection():
+    """Forget the cached IMAP session so the next call reconnects"""
+    global _imap, _selected
+    if _imap is not None:
+        try:
+            _imap.shutdown()
+        except OSError:
+            pass
+    _imap = None
+    _selected = None
+
+
+def _mail_error(e: Exception) -> str:
+    """Build a mail tool's error response, dropping the IMAP session if it broke"""
+    if isinstance(e, (imaplib.IMAP4.abort, OSError)):
+        _discard_imap_connection()
+    return json.dumps({
+        "success": False,
+        "error": str(e)
+    }, indent=2)
+
+
+# List views only need these headers; Content-Type is enough to flag multipart
+# messages, so message bodies and attachments are never downloaded. PEEK also
+# leaves the \Seen flag untouched.
+LIST_FETCH_ITEMS = '(BODY.PEEK[HEADER.FIELDS (FROM TO SUBJECT DATE CONTENT-TYPE)])'
+
+
+# Parsed messages keyed by (folder, UIDVALIDITY, UID); messages are immutable
+# once delivered, so entries never go stale within a UIDVALIDITY. Full
+# get_email results and search_emails header summaries are cached separately.
+EMAIL_CACHE_SIZE = 1024
+SUMMARY_CACHE_SIZE = 4096
+_email_cache: dict[tuple, dict] = {}
+_summary_cache: dict[tuple, dict] = {}
+
+_UID_RE = re.compile(rb'UID (\d+)')
+
+_message_parser = BytesParser(policy=default_policy)
+
+_UTF8_B64_WORD = re.compile(r'=\?utf-?8\?b\?([A-Za-z0-9+/=]+)\?=', re.IGNORECASE)
+
+
+def _optimize_sequence(ids) -> bytes:
+    """Collapse message IDs into an IMAP sequence set, e.g. b"1:4,7,9:11" """
+    numbers = sorted({int(i) for i in ids})
+    ranges = []
+    start = prev = numbers[0]
+    for n in numbers[1:]:
+        if n != prev + 1:
+            ranges.append(f"{start}:{prev}" if start != prev else str(start))
+            start = n
+        prev = n
+    ranges.append(f"{start}:{prev}" if start != prev else str(start))
+    return ",".join(ranges).encode()
+
+
+# Sized for a pull's worth of repeated senders and recipients; a hit also hands
+# back the same str object, so duplicate addresses share one copy
+@lru_cache(maxsize=8192)
+def _decode_header(value: str) -> str:
+    """Decode an RFC 2047 header; plain ASCII values skip the parser entirely"""
+    if '=?' not in value:
+        return value
+    # Most encoded headers are a single UTF-8 base64 word; decode it directly
+    match = _UTF8_B64_WORD.fullmatch(value)
+    if match:
+        try:
+            return base64.b64decode(match.group(1)).decode('utf-8', 'replace')
+        except binascii.Error:
+            pass
+    try:
+        return str(email.header.make_header(email.header.decode_header(value)))
+    except (LookupError, UnicodeDecodeError):
+        # Unknown or mislabelled charset; the raw header beats failing the call
+        return value
+
+
+def _header_text(message, name: str) -> str:
+    """Decoded text of a header from a compat32-parsed message"""
+    value = message.get(name, '')
+    if isinstance(value, str):
+        return _decode_header(value)
+    # compat32 hands back an (unhashable) Header for raw 8-bit values; read those as UTF-8
+    return ''.join(
+        chunk.decode('utf-8', 'replace') if isinstance(chunk, bytes) else chunk
+        for chunk, _ in email.header.decode_header(value)
+    )
+
+
+def _select(imap, folder: str) -> bytes:
+    """Select a folder unless it is already selected and return its UIDVALIDITY"""
+    global _selected
+    if _selected is not None and _selected[0] == folder:
+        return _selected[1]
+
+    status, _ = imap.select(folder)
+    _, data = imap.response('UIDVALIDITY')
+    uidvalidity = data[0] if data and data[0] else b''
+    _selected = (folder, uidvalidity) if status == 'OK' else None
+    return uidvalidity
+
+
+def _cache_put(cache: dict, max_size: int, key: tuple, value: dict) -> None:
+    """Cache a parsed message, evicting the oldest entry when full"""
+    if len(cache) >= max_size:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+def _uid_fetch(imap, uids, items: str) -> dict:
+    """UID FETCH a batch of messages and map each UID to its payload"""
+    status, msg_data = imap.uid('fetch', _optimize_sequence(uids), items)
+    fetched = {}
+    if status != 'OK':
+        return fetched
+
+    pending = None
+    for part in msg_data:
+        if isinstance(part, tuple):
+            match = _UID_RE.search(part[0])
+            if match:
+                fetched[match.group(1)] = part[1]
+            else:
+                pending = part[1]
+        elif pending is not None and part:
+            # Some servers report the UID after the literal
+            match = _UID_RE.search(part)
+            if match:
+                fetched[match.group(1)] = pending
+            pending = None
+    return fetched
+
 
 @mcp.tool()
 def list_mail_folders() -> str:
@@ -394,8 +558,6 @@ def list_mail_folders() -> str:
                 if len(parts) >= 3:
                     folder_list.append(parts[-2])
 
-        imap.logout()
-
         return json.dumps({
             "success": True,
             "count": len(folder_list),
@@ -403,10 +565,7 @@ def list_mail_folders() -> str:
         }, indent=2)
 
     except Exception as e:
-        return json.dumps({
-            "success": False,
-            "error": str(e)
-        }, indent=2)
+        return _mail_error(e)
 
 
 @mcp.tool()
@@ -425,9 +584,10 @@ def search_emails(folder: str = "INBOX", query: str = "ALL", max_results: int =
     """
     try:
         imap = get_imap_connection()
-        imap.select(folder)
+        uidvalidity = _select(imap, folder)
 
-        status, messages = imap.search(None, query)
+        # UIDs rather than sequence numbers, which shift on EXPUNGE
+        status, messages = imap.uid('search', None, query)
 
         emails = []
         if status == 'OK':
@@ -435,31 +595,33 @@ def search_emails(folder: str = "INBOX", query: str = "ALL", max_results: int =
             # Get most recent emails (reverse order)
             email_ids = email_ids[-max_results:]
 
-            for email_id in reversed(email_ids):
-                status, msg_data = imap.fetch(email_id, '(RFC822)')
-
-                if status == 'OK':
-                    email_body = msg_data[0][1]
-                    email_message = email.message_from_bytes(email_body)
-
-                    # Decode subject
-                    subject = email_message.get('Subject', '')
-                    if subject:
-                        decoded = email.header.decode_header(subject)
-                        subject = decoded[0][0]
-                        if isinstance(subject, bytes):
-                            subject = subject.decode()
-
-                    emails.append({
-                        "id": email_id.decode(),
-                        "from": email_message.get('From', ''),
-                        "to": email_message.get('To', ''),
-                        "subject": subject,
-                        "date": email_message.get('Date', ''),
-                        "has_attachments": bool(email_message.get_content_maintype() == 'multipart')
-                    })
-
-        imap.logout()
+            summaries = {}
+            missing = []
+            for email_id in email_ids:
+                cached = _summary_cache.get((folder, uidvalidity, email_id))
+                if cached is not None:
+                    summaries[email_id] = cached
+                else:
+                    missing.append(email_id)
+
+            # One FETCH for every uncached message instead of a round trip each
+            fetched = _uid_fetch(imap, missing, LIST_FETCH_ITEMS) if missing else {}
+
+            for email_id, email_headers in fetched.items():
+                email_message = email.message_from_bytes(email_headers)
+
+                summary = {
+                    "id": email_id.decode(),
+                    "from": _header_text(email_message, 'From'),
+                    "to": _header_text(email_message, 'To'),
+                    "subject": _header_text(email_message, 'Subject'),
+                    "date": email_message.get('Date', ''),
+                    "has_attachments": bool(email_message.get_content_maintype() == 'multipart')
+                }
+                summaries[email_id] = summary
+                _cache_put(_summary_cache, SUMMARY_CACHE_SIZE, (folder, uidvalidity, email_id), summary)
+
+            emails = [summaries[email_id] for email_id in reversed(email_ids) if email_id in summaries]
 
         return json.dumps({
             "success": True,
@@ -469,10 +631,7 @@ def search_emails(folder: str = "INBOX", query: str = "ALL", max_results: int =
         }, indent=2)
 
     except Exception as e:
-        return json.dumps({
-            "success": False,
-            "error": str(e)
-        }, indent=2)
+        return _mail_error(e)
 
 
 @mcp.tool()
@@ -489,57 +648,47 @@ def get_email(email_id: str, folder: str = "INBOX") -> str:
     """
     try:
         imap = get_imap_connection()
-        imap.select(folder)
+        uidvalidity = _select(imap, folder)
 
-        status, msg_data = imap.fetch(email_id.encode(), '(RFC822)')
+        cache_key = (folder, uidvalidity, email_id)
+        cached = _email_cache.get(cache_key)
+        if cached is not None:
+            return json.dumps({
+                "success": True,
+                "email": cached
+            }, indent=2)
+
+        email_body = _uid_fetch(imap, [email_id], '(RFC822)').get(email_id.encode())
 
-        if status != 'OK':
+        if email_body is None:
             return json.dumps({
                 "success": False,
                 "error": "Email not found"
             }, indent=2)
 
-        email_body = msg_data[0][1]
-        email_message = email.message_from_bytes(email_body)
-
-        # Decode subject
-        subject = email_message.get('Subject', '')
-        if subject:
-            decoded = email.header.decode_header(subject)
-            subject = decoded[0][0]
-            if isinstance(subject, bytes):
-                subject = subject.decode()
-
-        # Get body
-        body = ""
-        if email_message.is_multipart():
-            for part in email_message.walk():
-                if part.get_content_type() == "text/plain":
-                    body = part.get_payload(decode=True).decode()
-                    break
-        else:
-            body = email_message.get_payload(decode=True).decode()
-
-        imap.logout()
+        # The modern policy decodes headers on access and locates the text part
+        email_message = _message_parser.parsebytes(email_body)
+        body_part = email_message.get_body(preferencelist=('plain', 'html'))
+        body = body_part.get_content() if body_part is not None else ""
+
+        result = {
+            "id": email_id,
+            "from": str(email_message.get('From', '')),
+            "to": str(email_message.get('To', '')),
+            "cc": str(email_message.get('Cc', '')),
+            "subject": str(email_message.get('Subject', '')),
+            "date": str(email_message.get('Date', '')),
+            "body": body[:5000]  # Limit body length
+        }
+        _cache_put(_email_cache, EMAIL_CACHE_SIZE, cache_key, result)
 
         return json.dumps({
             "success": True,
-            "email": {
-                "id": email_id,
-                "from": email_message.get('From', ''),
-                "to": email_message.get('To', ''),
-                "cc": email_message.get('Cc', ''),
-                "subject": subject,
-                "date": email_message.get('Date', ''),
-                "body": body[:5000]  # Limit body length
-            }
+            "email": result
         }, indent=2)
 
     except Exception as e:
-        return json.dumps({
-            "success": False,
-            "error": str(e)
-        }, indent=2)
+        return _mail_error(e)
 
 
 @mcp.tool()
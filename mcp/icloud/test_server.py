@@ -0,0 +1,49 @@
+"""Tests for the iCloud mail tools"""
+
+import json
+import os
+
+os.environ.setdefault("ICLOUD_USERNAME", "user@icloud.com")
+os.environ.setdefault("ICLOUD_PASSWORD", "app-specific-password")
+
+import server  # noqa: E402
+
+
+class FakeIMAP:
+    """IMAP session stub serving one message's headers"""
+
+    def __init__(self, uid: bytes, headers: bytes):
+        self.uid_value = uid
+        self.headers = headers
+
+    def select(self, folder):
+        return 'OK', [b'1']
+
+    def response(self, code):
+        return code, [b'42']
+
+    def uid(self, command, *args):
+        if command == 'search':
+            return 'OK', [self.uid_value]
+        return 'OK', [(b'1 (UID ' + self.uid_value + b' BODY[HEADER] {0}', self.headers), b')']
+
+
+def _search(monkeypatch, headers: bytes) -> dict:
+    server._summary_cache.clear()
+    monkeypatch.setattr(server, '_selected', None)
+    monkeypatch.setattr(server, 'get_imap_connection', lambda: FakeIMAP(b'7', headers))
+    return json.loads(server.search_emails())
+
+
+def test_search_emails_decodes_raw_8bit_headers(monkeypatch):
+    headers = "Subject: café olé\r\nFrom: Zoë <z@example.com>\r\nTo: a@example.com\r\n\r\n".encode()
+    result = _search(monkeypatch, headers)
+    assert result["success"], result
+    assert result["emails"][0]["subject"] == "café olé"
+    assert result["emails"][0]["from"] == "Zoë <z@example.com>"
+
+
+def test_search_emails_decodes_encoded_words(monkeypatch):
+    headers = b"Subject: =?utf-8?b?Y2Fmw6k=?=\r\nFrom: a@example.com\r\n\r\n"
+    result = _search(monkeypatch, headers)
+    assert result["emails"][0]["subject"] == "café"
@@ -4,9 +4,116 @@ Aggregate data from multiple MCP services for comprehensive insights
 """
 
 import asyncio
+import heapq
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
-import json
+from itertools import chain
+from operator import attrgetter
+from typing import Dict, List, Any, Optional, Tuple, Iterator, Coroutine
+
+# Bind the decoder once; orjson is faster but optional
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+_sort_key = attrgetter("sort_key")
+_MESSAGE_DATE_FIELDS = ("date", "timestamp")
+
+# Which tool each service exposes per capability, in fan-out order.
+# Each entry is (service, tool, build_args); search entries also carry a result type.
+SERVICE_CAPABILITIES = {
+    "inbox": [
+        ("outlook", "get_unread_emails", lambda limit: {"limit": limit}),
+        ("google", "get_unread_emails", lambda limit: {"limit": limit}),
+        ("slack", "get_unread_messages", lambda limit: {"limit": limit}),
+    ],
+    "calendar": [
+        ("outlook", "get_today_events", lambda date: {}),
+        ("google", "get_calendar_events", lambda date: {"date": date}),
+    ],
+    "tasks": [
+        ("todoist", "get_tasks", lambda: {}),
+        ("google", "get_tasks", lambda: {}),
+        # Notion (if configured with tasks database)
+        ("notion", "query_database", lambda: {"database_id": "tasks"}),
+    ],
+    "search": [
+        ("outlook", "emails", "search_emails", lambda query, days: {"query": query, "days": days}),
+        ("google", "emails", "search_emails", lambda query, days: {"query": query, "days": days}),
+        ("slack", "messages", "search_messages", lambda query, days: {"query": query}),
+        ("notion", "pages", "search", lambda query, days: {"query": query}),
+        ("github", "code", "search_code", lambda query, days: {"query": query}),
+    ],
+}
+
+
+def _extend_tagged(target: List[Dict], items: List[Dict], service_name: str, tag: bool = True) -> None:
+    """Tag items with their source service (unless tag is False) and append them to target"""
+    if not tag:
+        target.extend(items)
+        return
+    append = target.append
+    for item in items:
+        item["_service"] = service_name
+        append(item)
+
+
+class _Ranked:
+    """Slots record pairing an item with its precomputed sort key"""
+
+    __slots__ = ("sort_key", "item", "service")
+
+    def __init__(self, sort_key: str, item: Dict, service: Optional[str] = None):
+        self.sort_key = sort_key
+        self.item = item
+        self.service = service
+
+
+def _rank(items: List[Dict], fields: Tuple[str, ...], service: Optional[str] = None) -> List[_Ranked]:
+    """Wrap items in _Ranked records keyed on the first non-empty of fields"""
+    ranked = []
+    for item in items:
+        key = ""
+        for field in fields:
+            value = item.get(field)
+            if value:
+                key = value
+                break
+        ranked.append(_Ranked(key, item, service))
+    return ranked
+
+
+def _parse_response(data: Any) -> Any:
+    """Unwrap an MCP tool response into its decoded payload"""
+    if isinstance(data, dict) and "content" in data:
+        content = data["content"][0]["text"] if data["content"] else "[]"
+        return _loads(content) if isinstance(content, str) else content
+    return data
+
+
+def _iter_lists(
+    responses: List[Tuple[str, Any]], errors: List[str], objects_only: bool = True
+) -> Iterator[Tuple[str, List]]:
+    """Yield (service, items) for every response that decodes to a list, recording failures in errors
+
+    With objects_only (the default) a list holding anything but dicts is recorded as an error too.
+    """
+    for service_name, data in responses:
+        if isinstance(data, BaseException):
+            errors.append(f"{service_name}: {str(data)}")
+            continue
+        try:
+            items = _parse_response(data)
+        except Exception as e:
+            errors.append(f"{service_name}: {str(e)}")
+            continue
+        if not isinstance(items, list):
+            continue
+        # Ranking and tagging assume dict items; reject the service rather than fail the whole call
+        if objects_only and not all(isinstance(item, dict) for item in items):
+            errors.append(f"{service_name}: expected a list of objects")
+            continue
+        yield service_name, items
 
 
 class CrossServiceTools:
@@ -14,8 +121,28 @@ class CrossServiceTools:
 
     def __init__(self, mcp_client):
         self.client = mcp_client
+        # Resolve configured services once rather than on every call
+        self._capabilities = {
+            capability: [entry for entry in entries if entry[0] in mcp_client.base_urls]
+            for capability, entries in SERVICE_CAPABILITIES.items()
+        }
 
-    async def unified_inbox(self, limit: int = 50) -> Dict[str, Any]:
+    def _calls(self, capability: str, *args) -> List[Tuple[str, Coroutine]]:
+        """Build (service, coroutine) tool calls for every configured service with a capability"""
+        return [
+            (service, self.client.call_tool(service, tool, build_args(*args)))
+            for service, tool, build_args in self._capabilities[capability]
+        ]
+
+    @staticmethod
+    async def _fetch(calls: List[Tuple[str, Coroutine]]) -> List[Tuple[str, Any]]:
+        """Await calls concurrently, pairing each service with its response or exception"""
+        responses = await asyncio.gather(*(coro for _, coro in calls), return_exceptions=True)
+        return [(service, response) for (service, _), response in zip(calls, responses)]
+
+    async def unified_inbox(
+        self, limit: int = 50, top_k: Optional[int] = None, tag_messages: bool = True
+    ) -> Dict[str, Any]:
         """
         Get unified view of unread messages from all email/messaging services
 
@@ -24,69 +151,68 @@ class CrossServiceTools:
         - Gmail unread emails
         - Slack unread messages
         - (Future: Teams, Discord, etc.)
+
+        If top_k is given, only the top_k most recent messages are kept in
+        all_messages; counts still reflect every message fetched. With
+        tag_messages=False messages are not tagged with _service.
         """
+        responses = await self._fetch(self._calls("inbox", limit))
+        return self._build_inbox(responses, top_k, tag_messages)
+
+    @staticmethod
+    def _build_inbox(
+        responses: List[Tuple[str, Any]], top_k: Optional[int] = None, tag: bool = True
+    ) -> Dict[str, Any]:
+        """Aggregate inbox responses into counts and date-sorted messages"""
         results = {
             "total_unread": 0,
             "by_service": {},
             "all_messages": [],
             "errors": []
         }
-
-        # Fetch from all services concurrently
-        tasks = []
-
-        # Outlook
-        if "outlook" in self.client.base_urls:
-            tasks.append(("outlook", self.client.call_tool("outlook", "get_unread_emails", {"limit": limit})))
-
-        # Google/Gmail
-        if "google" in self.client.base_urls:
-            tasks.append(("google", self.client.call_tool("google", "get_unread_emails", {"limit": limit})))
-
-        # Slack
-        if "slack" in self.client.base_urls:
-            tasks.append(("slack", self.client.call_tool("slack", "get_unread_messages", {"limit": limit})))
-
-        # Execute all requests
-        for service_name, task_coro in tasks:
-            try:
-                data = await task_coro
-                # Parse response
-                if isinstance(data, dict) and "content" in data:
-                    content = data["content"][0]["text"] if data["content"] else "{}"
-                    messages = json.loads(content) if isinstance(content, str) else content
-                else:
-                    messages = data
-
-                if isinstance(messages, list):
-                    # Add service tag to each message
-                    for msg in messages:
-                        msg["_service"] = service_name
-                    results["by_service"][service_name] = len(messages)
-                    results["all_messages"].extend(messages)
-                    results["total_unread"] += len(messages)
-            except Exception as e:
-                results["errors"].append(f"{service_name}: {str(e)}")
-
-        # Sort by date (most recent first)
-        results["all_messages"].sort(
-            key=lambda x: x.get("date", "") or x.get("timestamp", ""),
-            reverse=True
-        )
+        top = []
+
+        for service_name, messages in _iter_lists(responses, results["errors"]):
+            results["by_service"][service_name] = len(messages)
+            results["total_unread"] += len(messages)
+            if top_k is not None:
+                # Keep only a running top-K instead of every message
+                ranked = _rank(messages, _MESSAGE_DATE_FIELDS, service_name)
+                top = heapq.nlargest(top_k, chain(top, ranked), key=_sort_key)
+            else:
+                _extend_tagged(results["all_messages"], messages, service_name, tag)
+
+        # Sort by date (most recent first); the top-K path is already ordered
+        if top_k is None:
+            top = _rank(results["all_messages"], _MESSAGE_DATE_FIELDS)
+            top.sort(key=_sort_key, reverse=True)
+        elif tag:
+            # Only the surviving top-K messages need a service tag
+            for record in top:
+                record.item["_service"] = record.service
+        results["all_messages"] = [record.item for record in top]
 
         return results
 
-    async def unified_calendar(self, date: str = None) -> Dict[str, Any]:
+    async def unified_calendar(self, date: str = None, tag_messages: bool = True) -> Dict[str, Any]:
         """
         Get unified calendar view from all calendar services
 
         Combines:
         - Outlook calendar
         - Google Calendar
+
+        With tag_messages=False events are not tagged with _service.
         """
         if date is None:
             date = datetime.now().date().isoformat()
 
+        responses = await self._fetch(self._calls("calendar", date))
+        return self._build_calendar(responses, date, tag_messages)
+
+    @staticmethod
+    def _build_calendar(responses: List[Tuple[str, Any]], date: str, tag: bool = True) -> Dict[str, Any]:
+        """Aggregate calendar responses into start-time-sorted events"""
         results = {
             "date": date,
             "all_events": [],
@@ -94,43 +220,18 @@ class CrossServiceTools:
             "errors": []
         }
 
-        # Fetch from all services
-        tasks = []
-
-        # Outlook
-        if "outlook" in self.client.base_urls:
-            tasks.append(("outlook", self.client.call_tool("outlook", "get_today_events", {})))
-
-        # Google Calendar
-        if "google" in self.client.base_urls:
-            tasks.append(("google", self.client.call_tool("google", "get_calendar_events", {"date": date})))
-
-        # Execute requests
-        for service_name, task_coro in tasks:
-            try:
-                data = await task_coro
-                # Parse response
-                if isinstance(data, dict) and "content" in data:
-                    content = data["content"][0]["text"] if data["content"] else "[]"
-                    events = json.loads(content) if isinstance(content, str) else content
-                else:
-                    events = data
-
-                if isinstance(events, list):
-                    # Add service tag
-                    for event in events:
-                        event["_service"] = service_name
-                    results["by_service"][service_name] = len(events)
-                    results["all_events"].extend(events)
-            except Exception as e:
-                results["errors"].append(f"{service_name}: {str(e)}")
+        for service_name, events in _iter_lists(responses, results["errors"]):
+            results["by_service"][service_name] = len(events)
+            _extend_tagged(results["all_events"], events, service_name, tag)
 
         # Sort by start time
-        results["all_events"].sort(key=lambda x: x.get("start", ""))
+        ranked = _rank(results["all_events"], ("start",))
+        ranked.sort(key=_sort_key)
+        results["all_events"] = [record.item for record in ranked]
 
         return results
 
-    async def unified_tasks(self) -> Dict[str, Any]:
+    async def unified_tasks(self, top_k: Optional[int] = None, tag_messages: bool = True) -> Dict[str, Any]:
         """
         Get unified task list from all task management services
 
@@ -138,7 +239,19 @@ class CrossServiceTools:
         - Todoist tasks
         - Google Tasks
         - Notion tasks
+
+        If top_k is given, only the first top_k tasks are kept in all_tasks;
+        total_tasks still reflects every task fetched. With tag_messages=False
+        tasks are not tagged with _service.
         """
+        responses = await self._fetch(self._calls("tasks"))
+        return self._build_tasks(responses, top_k, tag_messages)
+
+    @staticmethod
+    def _build_tasks(
+        responses: List[Tuple[str, Any]], top_k: Optional[int] = None, tag: bool = True
+    ) -> Dict[str, Any]:
+        """Aggregate task responses into counts and a merged task list"""
         results = {
             "total_tasks": 0,
             "by_service": {},
@@ -146,40 +259,13 @@ class CrossServiceTools:
             "errors": []
         }
 
-        tasks = []
-
-        # Todoist
-        if "todoist" in self.client.base_urls:
-            tasks.append(("todoist", self.client.call_tool("todoist", "get_tasks", {})))
-
-        # Google Tasks
-        if "google" in self.client.base_urls:
-            tasks.append(("google", self.client.call_tool("google", "get_tasks", {})))
-
-        # Notion (if configured with tasks database)
-        if "notion" in self.client.base_urls:
-            tasks.append(("notion", self.client.call_tool("notion", "query_database", {"database_id": "tasks"})))
-
-        # Execute requests
-        for service_name, task_coro in tasks:
-            try:
-                data = await task_coro
-                # Parse response
-                if isinstance(data, dict) and "content" in data:
-                    content = data["content"][0]["text"] if data["content"] else "[]"
-                    task_list = json.loads(content) if isinstance(content, str) else content
-                else:
-                    task_list = data
-
-                if isinstance(task_list, list):
-                    # Add service tag
-                    for task in task_list:
-                        task["_service"] = service_name
-                    results["by_service"][service_name] = len(task_list)
-                    results["all_tasks"].extend(task_list)
-                    results["total_tasks"] += len(task_list)
-            except Exception as e:
-                results["errors"].append(f"{service_name}: {str(e)}")
+        for service_name, task_list in _iter_lists(responses, results["errors"]):
+            results["by_service"][service_name] = len(task_list)
+            results["total_tasks"] += len(task_list)
+            if top_k is not None:
+                # Only tag and keep what still fits in the top-K
+                task_list = task_list[:max(top_k - len(results["all_tasks"]), 0)]
+            _extend_tagged(results["all_tasks"], task_list, service_name, tag)
 
         return results
 
@@ -193,9 +279,10 @@ class CrossServiceTools:
         - Tasks due today (all services)
         - Priority recommendations
         """
+        now = datetime.now()
         briefing = {
-            "date": datetime.now().date().isoformat(),
-            "generated_at": datetime.now().isoformat(),
+            "date": now.date().isoformat(),
+            "generated_at": now.isoformat(),
             "summary": {},
             "inbox_overview": {},
             "calendar_overview": {},
@@ -203,46 +290,42 @@ class CrossServiceTools:
             "recommendations": []
         }
 
-        # Fetch all data concurrently
-        inbox_task = self.unified_inbox(limit=100)
-        calendar_task = self.unified_calendar()
-        tasks_task = self.unified_tasks()
+        # Fan out to every upstream service in a single gather, then bucket
+        inbox_calls = self._calls("inbox", 100)
+        calendar_calls = self._calls("calendar", briefing["date"])
+        task_calls = self._calls("tasks")
+        responses = await self._fetch(inbox_calls + calendar_calls + task_calls)
 
-        # Wait for all
-        inbox_data, calendar_data, tasks_data = await asyncio.gather(
-            inbox_task,
-            calendar_task,
-            tasks_task,
-            return_exceptions=True
-        )
+        calendar_start = len(inbox_calls)
+        tasks_start = calendar_start + len(calendar_calls)
+        inbox_data = self._build_inbox(responses[:calendar_start], top_k=5)
+        calendar_data = self._build_calendar(responses[calendar_start:tasks_start], briefing["date"])
+        tasks_data = self._build_tasks(responses[tasks_start:], top_k=10)
 
         # Process results
-        if not isinstance(inbox_data, Exception):
-            briefing["inbox_overview"] = {
-                "total_unread": inbox_data.get("total_unread", 0),
-                "by_service": inbox_data.get("by_service", {}),
-                "top_5_messages": inbox_data.get("all_messages", [])[:5]
-            }
+        briefing["inbox_overview"] = {
+            "total_unread": inbox_data["total_unread"],
+            "by_service": inbox_data["by_service"],
+            "top_5_messages": inbox_data["all_messages"]
+        }
 
-        if not isinstance(calendar_data, Exception):
-            briefing["calendar_overview"] = {
-                "total_events": len(calendar_data.get("all_events", [])),
-                "by_service": calendar_data.get("by_service", {}),
-                "all_events": calendar_data.get("all_events", [])
-            }
+        briefing["calendar_overview"] = {
+            "total_events": len(calendar_data["all_events"]),
+            "by_service": calendar_data["by_service"],
+            "all_events": calendar_data["all_events"]
+        }
 
-        if not isinstance(tasks_data, Exception):
-            briefing["tasks_overview"] = {
-                "total_tasks": tasks_data.get("total_tasks", 0),
-                "by_service": tasks_data.get("by_service", {}),
-                "top_10_tasks": tasks_data.get("all_tasks", [])[:10]
-            }
+        briefing["tasks_overview"] = {
+            "total_tasks": tasks_data["total_tasks"],
+            "by_service": tasks_data["by_service"],
+            "top_10_tasks": tasks_data["all_tasks"]
+        }
 
         # Generate summary
         briefing["summary"] = {
-            "unread_messages": briefing["inbox_overview"].get("total_unread", 0),
-            "meetings_today": len(briefing["calendar_overview"].get("all_events", [])),
-            "active_tasks": briefing["tasks_overview"].get("total_tasks", 0)
+            "unread_messages": inbox_data["total_unread"],
+            "meetings_today": len(calendar_data["all_events"]),
+            "active_tasks": tasks_data["total_tasks"]
         }
 
         # Generate recommendations
@@ -300,48 +383,20 @@ class CrossServiceTools:
             "errors": []
         }
 
-        tasks = []
-
-        # Outlook
-        if "outlook" in self.client.base_urls:
-            tasks.append(("outlook", "emails", self.client.call_tool("outlook", "search_emails", {"query": query, "days": days})))
-
-        # Google/Gmail
-        if "google" in self.client.base_urls:
-            tasks.append(("google", "emails", self.client.call_tool("google", "search_emails", {"query": query, "days": days})))
-
-        # Slack
-        if "slack" in self.client.base_urls:
-            tasks.append(("slack", "messages", self.client.call_tool("slack", "search_messages", {"query": query})))
-
-        # Notion
-        if "notion" in self.client.base_urls:
-            tasks.append(("notion", "pages", self.client.call_tool("notion", "search", {"query": query})))
-
-        # GitHub
-        if "github" in self.client.base_urls:
-            tasks.append(("github", "code", self.client.call_tool("github", "search_code", {"query": query})))
-
-        # Execute all searches
-        for service_name, result_type, task_coro in tasks:
-            try:
-                data = await task_coro
-                # Parse response
-                if isinstance(data, dict) and "content" in data:
-                    content = data["content"][0]["text"] if data["content"] else "[]"
-                    search_results = json.loads(content) if isinstance(content, str) else content
-                else:
-                    search_results = data
-
-                if isinstance(search_results, list):
-                    key = f"{service_name}_{result_type}"
-                    results["by_service"][key] = {
-                        "count": len(search_results),
-                        "results": search_results
-                    }
-                    results["total_results"] += len(search_results)
-            except Exception as e:
-                results["errors"].append(f"{service_name}: {str(e)}")
+        entries = self._capabilities["search"]
+        responses = await self._fetch([
+            (service, self.client.call_tool(service, tool, build_args(query, days)))
+            for service, _, tool, build_args in entries
+        ])
+        result_types = {service: result_type for service, result_type, _, _ in entries}
+
+        for service_name, search_results in _iter_lists(responses, results["errors"], objects_only=False):
+            key = f"{service_name}_{result_types[service_name]}"
+            results["by_service"][key] = {
+                "count": len(search_results),
+                "results": search_results
+            }
+            results["total_results"] += len(search_results)
 
         return results
 
@@ -355,22 +410,28 @@ class CrossServiceTools:
             "unhealthy_services": 0
         }
 
-        for service_name, base_url in self.client.base_urls.items():
-            try:
-                # Try to list tools (simple health check)
-                tools = await self.client.list_tools(service_name)
+        # Probe all services concurrently so one hung service costs a single timeout
+        names = list(self.client.base_urls)
+        probes = await asyncio.gather(
+            *(self.client.list_tools(name) for name in names),
+            return_exceptions=True
+        )
+
+        for service_name, tools in zip(names, probes):
+            base_url = self.client.base_urls[service_name]
+            if isinstance(tools, BaseException):
                 health["services"][service_name] = {
-                    "status": "healthy",
+                    "status": "unhealthy",
                     "url": base_url,
-                    "tools_available": len(tools)
+                    "error": str(tools)
                 }
-                health["healthy_services"] += 1
-            except Exception as e:
+                health["unhealthy_services"] += 1
+            else:
                 health["services"][service_name] = {
-                    "status": "unhealthy",
+                    "status": "healthy",
                     "url": base_url,
-                    "error": str(e)
+                    "tools_available": len(tools)
                 }
-                health["unhealthy_services"] += 1
+                health["healthy_services"] += 1
 
         return health
@@ -2,11 +2,20 @@
 MCP Client - Make requests to other MCP servers
 """
 
+import asyncio
 import aiohttp
 import json
+import logging
+import time
 from typing import Dict, List, Any, Optional
 
 
+logger = logging.getLogger(__name__)
+
+# How long a service's tool list is reused before it is fetched again
+TOOLS_CACHE_TTL = 60
+
+
 class MCPClient:
     """Client to interact with other MCP servers"""
 
@@ -20,6 +29,7 @@ class MCPClient:
         """
         self.base_urls = base_urls
         self.session = None
+        self._tools_cache: Dict[str, tuple] = {}
 
     async def _ensure_session(self):
         """Ensure aiohttp session exists"""
@@ -67,13 +77,19 @@ class MCPClient:
                 else:
                     error_text = await response.text()
                     raise Exception(f"Error calling {service}.{tool_name}: {response.status} - {error_text}")
+        except asyncio.TimeoutError:
+            raise Exception(f"Timeout calling {service}.{tool_name}")
         except aiohttp.ClientError as e:
             raise Exception(f"Network error calling {service}.{tool_name}: {str(e)}")
-        except Exception as e:
-            raise Exception(f"Error calling {service}.{tool_name}: {str(e)}")
+        except json.JSONDecodeError as e:
+            raise Exception(f"Invalid response from {service}.{tool_name}: {str(e)}")
 
     async def list_tools(self, service: str) -> List[Dict]:
-        """List available tools for a service"""
+        """List available tools for a service (cached for TOOLS_CACHE_TTL seconds)"""
+        cached_at, tools = self._tools_cache.get(service, (0.0, None))
+        if tools is not None and time.monotonic() - cached_at < TOOLS_CACHE_TTL:
+            return tools
+
         await self._ensure_session()
 
         if service not in self.base_urls:
@@ -82,11 +98,16 @@ class MCPClient:
         url = f"{self.base_urls[service]}/tools/list"
 
         try:
-            async with self.session.get(url, timeout=10) as response:
+            async with self.session.get(url, timeout=5) as response:
                 if response.status == 200:
                     data = await response.json()
-                    return data.get("tools", [])
+                    tools = data.get("tools", [])
+                    self._tools_cache[service] = (time.monotonic(), tools)
+                    return tools
                 else:
+                    self._tools_cache.pop(service, None)
                     return []
-        except:
+        except (aiohttp.ClientError, asyncio.TimeoutError, json.JSONDecodeError) as e:
+            logger.debug(f"Listing tools for {service} failed: {e!r}")
+            self._tools_cache.pop(service, None)
             return []
@@ -8,6 +8,7 @@ import os
 import sys
 import json
 import logging
+from typing import Any, Awaitable, Callable, Dict
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
@@ -15,6 +16,16 @@ from mcp.types import Tool, TextContent
 from mcp_client import MCPClient
 from cross_service_tools import CrossServiceTools
 
+# orjson serializes straight to UTF-8 bytes; fall back to the stdlib if missing
+try:
+    import orjson
+
+    def dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    def dumps(obj) -> str:
+        return json.dumps(obj)
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -124,45 +135,33 @@ async def list_tools() -> list[Tool]:
     ]
 
 
+# Tool name -> coroutine taking the tool arguments
+HANDLERS: Dict[str, Callable[[dict], Awaitable[Any]]] = {
+    "unified_inbox": lambda args: cross_service_tools.unified_inbox(limit=args.get("limit", 50)),
+    "unified_calendar": lambda args: cross_service_tools.unified_calendar(date=args.get("date")),
+    "unified_tasks": lambda args: cross_service_tools.unified_tasks(),
+    "comprehensive_briefing": lambda args: cross_service_tools.comprehensive_briefing(),
+    "search_everywhere": lambda args: cross_service_tools.search_everywhere(
+        query=args["query"], days=args.get("days", 30)
+    ),
+    "service_health_check": lambda args: cross_service_tools.service_health_check(),
+}
+
+
 @app.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     """Handle tool calls"""
+    handler = HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
     try:
-        if name == "unified_inbox":
-            limit = arguments.get("limit", 50)
-            result = await cross_service_tools.unified_inbox(limit=limit)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        elif name == "unified_calendar":
-            date = arguments.get("date")
-            result = await cross_service_tools.unified_calendar(date=date)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        elif name == "unified_tasks":
-            result = await cross_service_tools.unified_tasks()
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        elif name == "comprehensive_briefing":
-            result = await cross_service_tools.comprehensive_briefing()
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        elif name == "search_everywhere":
-            query = arguments["query"]
-            days = arguments.get("days", 30)
-            result = await cross_service_tools.search_everywhere(query=query, days=days)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        elif name == "service_health_check":
-            result = await cross_service_tools.service_health_check()
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+        result = await handler(arguments)
+        return [TextContent(type="text", text=dumps(result))]
 
     except Exception as e:
         logger.error(f"Error calling tool {name}: {str(e)}", exc_info=True)
-        return [TextContent(type="text", text=json.dumps({"error": str(e)}))]
+        return [TextContent(type="text", text=dumps({"error": str(e)}))]
 
 
 async def main():
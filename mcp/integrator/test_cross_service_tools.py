@@ -0,0 +1,46 @@
+"""Tests for cross-service aggregation"""
+
+import asyncio
+
+from cross_service_tools import CrossServiceTools
+
+
+class FakeClient:
+    """MCP client stub returning canned payloads per service"""
+
+    def __init__(self, payloads):
+        self.payloads = payloads
+        self.base_urls = dict.fromkeys(payloads, "http://localhost")
+
+    async def call_tool(self, service, tool, arguments):
+        return self.payloads[service]
+
+
+def _tools():
+    return CrossServiceTools(FakeClient({
+        "outlook": [{"subject": "older", "date": "2024-01-01", "start": "09:00"}],
+        "google": ["a", "b"],
+        "slack": [{"text": "newer", "timestamp": "2024-01-02"}],
+        "todoist": [{"content": "write tests"}],
+    }))
+
+
+def test_unified_inbox_skips_service_with_non_object_items():
+    result = asyncio.run(_tools().unified_inbox())
+    assert result["total_unread"] == 2
+    assert set(result["by_service"]) == {"outlook", "slack"}
+    assert result["errors"] == ["google: expected a list of objects"]
+    assert [m["_service"] for m in result["all_messages"]] == ["slack", "outlook"]
+
+
+def test_unified_inbox_top_k_skips_service_with_non_object_items():
+    result = asyncio.run(_tools().unified_inbox(top_k=1))
+    assert result["total_unread"] == 2
+    assert [m["_service"] for m in result["all_messages"]] == ["slack"]
+    assert result["errors"] == ["google: expected a list of objects"]
+
+
+def test_comprehensive_briefing_skips_service_with_non_object_items():
+    briefing = asyncio.run(_tools().comprehensive_briefing())
+    assert briefing["summary"] == {"unread_messages": 2, "meetings_today": 1, "active_tasks": 1}
+    assert briefing["tasks_overview"]["by_service"] == {"todoist": 1}
@@ -13,13 +13,15 @@ Features:
 
 import os
 import json
+import time
 import asyncio
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 
 # Notion API import
 try:
+    import httpx
     from notion_client import Client
     from notion_client.errors import APIResponseError
 except ImportError:
@@ -27,6 +29,12 @@ except ImportError:
     print("Install with: pip install notion-client")
     exit(1)
 
+# orjson serializes several times faster than json; fall back if missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ============================================================================
 # Configuration
 # ============================================================================
@@ -41,61 +49,180 @@ if not NOTION_TOKEN:
     print("Get your token from: https://www.notion.so/my-integrations")
     exit(1)
 
-# Initialize Notion client
-notion = Client(auth=NOTION_TOKEN)
+# Initialize Notion client on one pooled HTTP client shared by all worker threads.
+# httpx drops idle connections after 5s by default; keep them long enough that
+# tool calls a few seconds apart don't each pay a fresh TLS handshake.
+notion = Client(
+    auth=NOTION_TOKEN,
+    client=httpx.Client(limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60))
+)
+
+# Name of the title property per database (Notion allows exactly one)
+_title_prop_cache: dict[str, str] = {}
+
+# Notion allows ~3 requests/s; cap how many SDK calls run in worker threads at once
+MAX_CONCURRENT_REQUESTS = 5
+_request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+# Short-lived cache for read-only listings and searches
+RESPONSE_CACHE_TTL = 60
+RESPONSE_CACHE_SIZE = 256
+_response_cache: dict[tuple, tuple[float, Any]] = {}
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def _text_result(text: str) -> list[dict[str, Any]]:
+    """Wrap serialized output in the MCP text-content envelope"""
+    return [{"type": "text", "text": text}]
+
+def _dumps(obj: Any, pretty: bool = False) -> str:
+    """Serialize a tool result as compact JSON, or indented if pretty"""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    if pretty:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+def _extract_title(page: dict) -> str:
+    """Get a page's title, looking up its database's title property name once"""
+    properties = page.get("properties", {})
+    database_id = page.get("parent", {}).get("database_id")
+
+    prop_name = _title_prop_cache.get(database_id)
+    if prop_name not in properties:
+        prop_name = next(
+            (name for name, value in properties.items() if value.get("type") == "title"),
+            None
+        )
+        if prop_name is None:
+            return "Untitled"
+        if database_id:
+            _title_prop_cache[database_id] = prop_name
+
+    title = properties[prop_name].get("title")
+    return title[0].get("plain_text", "Untitled") if title else "Untitled"
+
+def _database_title(database: dict) -> str:
+    """Get a database's title from its top-level title array"""
+    title = database.get("title")
+    return title[0].get("plain_text", "Untitled") if title else "Untitled"
+
+def _normalize_query(query: str) -> str:
+    """Fold case and whitespace so trivially different searches share a cache entry"""
+    return " ".join(query.casefold().split())
+
+def _cache_get(key: tuple) -> Any:
+    """Return a cached response if it is younger than RESPONSE_CACHE_TTL"""
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    cached_at, value = entry
+    if time.monotonic() - cached_at >= RESPONSE_CACHE_TTL:
+        del _response_cache[key]
+        return None
+    return value
+
+def _cache_put(key: tuple, value: Any) -> None:
+    """Cache a response, evicting the oldest entry when full"""
+    if len(_response_cache) >= RESPONSE_CACHE_SIZE:
+        del _response_cache[next(iter(_response_cache))]
+    _response_cache[key] = (time.monotonic(), value)
+
+async def _call(sdk_call, **params) -> Any:
+    """Run a blocking notion-client call in a worker thread without stalling the event loop"""
+    async with _request_semaphore:
+        return await asyncio.to_thread(sdk_call, **params)
+
+# Largest page Notion's list endpoints will return
+NOTION_PAGE_SIZE = 100
+
+async def _paginate(sdk_call, max_results: Optional[int], **params):
+    """
+    Yield up to max_results items (all if None) from a cursor-paginated Notion endpoint
+
+    Each request runs in a worker thread via _call. Paging stops as soon as
+    max_results items are collected, and the next page is requested before
+    the current page is handed to the caller, so shaping results overlaps
+    with the following round trip.
+    """
+    remaining = max_results if max_results is not None else float("inf")
+    response = await _call(sdk_call, page_size=min(remaining, NOTION_PAGE_SIZE), **params)
+
+    while True:
+        results = response.get("results", [])
+        if len(results) > remaining:
+            results = results[:remaining]
+        remaining -= len(results)
+
+        next_page = None
+        if response.get("has_more") and response.get("next_cursor") and remaining > 0:
+            next_page = asyncio.create_task(_call(
+                sdk_call,
+                start_cursor=response["next_cursor"],
+                page_size=min(remaining, NOTION_PAGE_SIZE),
+                **params
+            ))
+
+        for item in results:
+            yield item
+
+        if next_page is None:
+            return
+        response = await next_page
 
 # ============================================================================
 # Database Functions
 # ============================================================================
 
-def list_databases(max_results: int = 20) -> list[dict]:
+async def list_databases(max_results: int = 20) -> list[dict]:
     """List all accessible databases"""
-    try:
-        results = notion.search(
-            filter={"property": "object", "value": "database"},
-            page_size=min(max_results, 100)
-        )
+    cache_key = ("list_databases", max_results)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
 
+    try:
         databases = []
-        for db in results.get("results", []):
+        async for db in _paginate(
+            notion.search,
+            max_results,
+            filter={"property": "object", "value": "database"}
+        ):
             databases.append({
                 'id': db['id'],
-                'title': db.get('title', [{}])[0].get('plain_text', 'Untitled') if db.get('title') else 'Untitled',
+                'title': _database_title(db),
                 'url': db.get('url', ''),
                 'created_time': db.get('created_time', ''),
                 'last_edited_time': db.get('last_edited_time', '')
             })
 
+        _cache_put(cache_key, databases)
         return databases
 
     except APIResponseError as e:
         return [{'error': f'Notion API error: {e}'}]
 
-def query_database(database_id: str, filter_obj: Optional[dict] = None,
-                  sorts: Optional[list] = None, max_results: int = 20) -> list[dict]:
+async def query_database(database_id: str, filter_obj: Optional[dict] = None,
+                        sorts: Optional[list] = None, max_results: int = 20) -> list[dict]:
     """Query a database with optional filters and sorts"""
     try:
-        query_params = {"page_size": min(max_results, 100)}
+        query_params = {}
 
         if filter_obj:
             query_params["filter"] = filter_obj
         if sorts:
             query_params["sorts"] = sorts
 
-        results = notion.databases.query(database_id=database_id, **query_params)
-
         pages = []
-        for page in results.get("results", []):
-            # Extract title from properties
-            title = "Untitled"
-            for prop_name, prop_value in page.get("properties", {}).items():
-                if prop_value.get("type") == "title" and prop_value.get("title"):
-                    title = prop_value["title"][0].get("plain_text", "Untitled")
-                    break
-
+        async for page in _paginate(
+            notion.databases.query, max_results, database_id=database_id, **query_params
+        ):
             pages.append({
                 'id': page['id'],
-                'title': title,
+                'title': _extract_title(page),
                 'url': page.get('url', ''),
                 'created_time': page.get('created_time', ''),
                 'last_edited_time': page.get('last_edited_time', ''),
@@ -111,21 +238,14 @@ def query_database(database_id: str, filter_obj: Optional[dict] = None,
 # Page Functions
 # ============================================================================
 
-def get_page(page_id: str) -> dict:
+async def get_page(page_id: str) -> dict:
     """Get page details"""
     try:
-        page = notion.pages.retrieve(page_id=page_id)
-
-        # Extract title
-        title = "Untitled"
-        for prop_name, prop_value in page.get("properties", {}).items():
-            if prop_value.get("type") == "title" and prop_value.get("title"):
-                title = prop_value["title"][0].get("plain_text", "Untitled")
-                break
+        page = await _call(notion.pages.retrieve, page_id=page_id)
 
         return {
             'id': page['id'],
-            'title': title,
+            'title': _extract_title(page),
             'url': page.get('url', ''),
             'created_time': page.get('created_time', ''),
             'last_edited_time': page.get('last_edited_time', ''),
@@ -135,8 +255,8 @@ def get_page(page_id: str) -> dict:
     except APIResponseError as e:
         return {'error': f'Failed to get page: {e}'}
 
-def create_page(parent_id: str, parent_type: str = 'database_id',
-               title: str = 'Untitled', properties: Optional[dict] = None) -> dict:
+async def create_page(parent_id: str, parent_type: str = 'database_id',
+                     title: str = 'Untitled', properties: Optional[dict] = None) -> dict:
     """Create a new page in a database or as a child of another page"""
     try:
         # Build parent object
@@ -158,11 +278,14 @@ def create_page(parent_id: str, parent_type: str = 'database_id',
                 }
                 break
 
-        page = notion.pages.create(
+        page = await _call(
+            notion.pages.create,
             parent=parent,
             properties=page_properties
         )
 
+        # Titles and listings may have changed
+        _response_cache.clear()
         return {
             'success': True,
             'id': page['id'],
@@ -172,11 +295,13 @@ def create_page(parent_id: str, parent_type: str = 'database_id',
     except APIResponseError as e:
         return {'error': f'Failed to create page: {e}'}
 
-def update_page(page_id: str, properties: dict) -> dict:
+async def update_page(page_id: str, properties: dict) -> dict:
     """Update page properties"""
     try:
-        page = notion.pages.update(page_id=page_id, properties=properties)
+        page = await _call(notion.pages.update, page_id=page_id, properties=properties)
 
+        # Titles and listings may have changed
+        _response_cache.clear()
         return {
             'success': True,
             'id': page['id'],
@@ -190,43 +315,75 @@ def update_page(page_id: str, properties: dict) -> dict:
 # Block Functions
 # ============================================================================
 
-def get_page_content(page_id: str) -> dict:
-    """Get all blocks (content) from a page"""
-    try:
-        blocks = notion.blocks.children.list(block_id=page_id)
-
-        content = []
-        for block in blocks.get("results", []):
-            block_type = block.get("type", "unknown")
-            block_content = block.get(block_type, {})
-
-            # Extract text content if available
-            text_content = ""
-            if "rich_text" in block_content:
-                text_content = " ".join([
-                    rt.get("plain_text", "")
-                    for rt in block_content.get("rich_text", [])
-                ])
-
-            content.append({
-                'id': block['id'],
-                'type': block_type,
-                'content': text_content or str(block_content)[:200]
-            })
+# Nested blocks are expanded concurrently up to this depth
+MAX_BLOCK_DEPTH = 3
+
+# Blocks whose children are separate pages/databases rather than page content
+_NO_EXPAND_TYPES = {"child_page", "child_database"}
+
+# Layout-only blocks; their content lives in their children
+_STRUCTURAL_TYPES = {
+    "column_list", "column", "divider", "table", "synced_block",
+    "breadcrumb", "table_of_contents"
+}
+
+def _shape_block(block: dict) -> dict:
+    """Reduce a Notion block to its id, type and text content"""
+    block_type = block.get("type", "unknown")
+    block_content = block.get(block_type, {})
+
+    # Use text content if the block has any; otherwise a short raw preview,
+    # except for layout blocks whose payload carries nothing readable
+    if "rich_text" in block_content:
+        content = " ".join(rt.get("plain_text", "") for rt in block_content["rich_text"])
+    elif block_type in _STRUCTURAL_TYPES:
+        content = ""
+    else:
+        content = str(block_content)[:200]
+
+    return {
+        'id': block['id'],
+        'type': block_type,
+        'content': content
+    }
+
+async def _fetch_blocks(block_id: str, depth: int) -> list[dict]:
+    """Fetch all of a block's children, expanding nested blocks concurrently"""
+    blocks = [
+        block async for block in _paginate(notion.blocks.children.list, None, block_id=block_id)
+    ]
+    content = [_shape_block(block) for block in blocks]
+
+    if depth > 0:
+        nested = [
+            (entry, block) for entry, block in zip(content, blocks)
+            if block.get("has_children") and block.get("type") not in _NO_EXPAND_TYPES
+        ]
+        children = await asyncio.gather(
+            *(_fetch_blocks(block['id'], depth - 1) for _, block in nested)
+        )
+        for (entry, _), child_content in zip(nested, children):
+            entry['children'] = child_content
 
+    return content
+
+async def get_page_content(page_id: str) -> dict:
+    """Get all blocks (content) from a page, including nested blocks"""
+    try:
         return {
             'page_id': page_id,
-            'blocks': content
+            'blocks': await _fetch_blocks(page_id, MAX_BLOCK_DEPTH)
         }
 
     except APIResponseError as e:
         return {'error': f'Failed to get page content: {e}'}
 
-def append_block_children(page_id: str, blocks: list[dict]) -> dict:
+async def append_block_children(page_id: str, blocks: list[dict]) -> dict:
     """Append blocks to a page"""
     try:
-        result = notion.blocks.children.append(block_id=page_id, children=blocks)
+        result = await _call(notion.blocks.children.append, block_id=page_id, children=blocks)
 
+        _response_cache.clear()
         return {
             'success': True,
             'blocks_added': len(result.get("results", []))
@@ -239,38 +396,31 @@ def append_block_children(page_id: str, blocks: list[dict]) -> dict:
 # Search Functions
 # ============================================================================
 
-def search_notion(query: str, filter_type: Optional[str] = None,
-                 max_results: int = 20) -> list[dict]:
+async def search_notion(query: str, filter_type: Optional[str] = None,
+                       max_results: int = 20) -> list[dict]:
     """Search across Notion workspace"""
+    cache_key = ("search", _normalize_query(query), filter_type, max_results)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        search_params = {"query": query, "page_size": min(max_results, 100)}
+        search_params = {"query": query}
 
         if filter_type:
             search_params["filter"] = {"property": "object", "value": filter_type}
 
-        results = notion.search(**search_params)
-
         items = []
-        for item in results.get("results", []):
-            # Extract title based on type
-            title = "Untitled"
-            if item["object"] == "page":
-                for prop_name, prop_value in item.get("properties", {}).items():
-                    if prop_value.get("type") == "title" and prop_value.get("title"):
-                        title = prop_value["title"][0].get("plain_text", "Untitled")
-                        break
-            elif item["object"] == "database":
-                if item.get('title'):
-                    title = item['title'][0].get('plain_text', 'Untitled')
-
+        async for item in _paginate(notion.search, max_results, **search_params):
             items.append({
                 'id': item['id'],
                 'object': item['object'],
-                'title': title,
+                'title': _extract_title(item) if item["object"] == "page" else _database_title(item),
                 'url': item.get('url', ''),
                 'last_edited_time': item.get('last_edited_time', '')
             })
 
+        _cache_put(cache_key, items)
         return items
 
     except APIResponseError as e:
@@ -280,13 +430,16 @@ def search_notion(query: str, filter_type: Optional[str] = None,
 # User Functions
 # ============================================================================
 
-def list_users(max_results: int = 20) -> list[dict]:
+async def list_users(max_results: int = 20) -> list[dict]:
     """List all users in workspace"""
-    try:
-        results = notion.users.list(page_size=min(max_results, 100))
+    cache_key = ("list_users", max_results)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
 
+    try:
         users = []
-        for user in results.get("results", []):
+        async for user in _paginate(notion.users.list, max_results):
             users.append({
                 'id': user['id'],
                 'type': user.get('type', 'unknown'),
@@ -294,6 +447,7 @@ def list_users(max_results: int = 20) -> list[dict]:
                 'avatar_url': user.get('avatar_url', '')
             })
 
+        _cache_put(cache_key, users)
         return users
 
     except APIResponseError as e:
@@ -305,286 +459,323 @@ def list_users(max_results: int = 20) -> list[dict]:
 
 app = Server(SERVER_NAME)
 
+# Static resource and tool listings, built once at import
+RESOURCES: list[dict[str, Any]] = [
+    {
+        "uri": "notion://databases",
+        "name": "Databases",
+        "description": "All accessible databases",
+        "mimeType": "application/json"
+    },
+    {
+        "uri": "notion://search/recent",
+        "name": "Recent Pages",
+        "description": "Recently edited pages",
+        "mimeType": "application/json"
+    }
+]
+
+TOOLS: list[dict[str, Any]] = [
+    # Database tools
+    {
+        "name": "list_databases",
+        "description": "List all accessible databases in workspace",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "max_results": {
+                    "type": "number",
+                    "description": "Maximum results (default: 20)",
+                    "default": 20
+                }
+            },
+            "required": []
+        }
+    },
+    {
+        "name": "query_database",
+        "description": "Query a database with optional filters and sorts",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "database_id": {
+                    "type": "string",
+                    "description": "Database ID"
+                },
+                "filter": {
+                    "type": "object",
+                    "description": "Filter object (Notion API format) (optional)"
+                },
+                "sorts": {
+                    "type": "array",
+                    "description": "Sort array (Notion API format) (optional)"
+                },
+                "max_results": {
+                    "type": "number",
+                    "description": "Maximum results (default: 20)",
+                    "default": 20
+                }
+            },
+            "required": ["database_id"]
+        }
+    },
+    # Page tools
+    {
+        "name": "get_page",
+        "description": "Get page details and properties",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "page_id": {
+                    "type": "string",
+                    "description": "Page ID"
+                }
+            },
+            "required": ["page_id"]
+        }
+    },
+    {
+        "name": "create_page",
+        "description": "Create a new page in a database or as child of another page",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "parent_id": {
+                    "type": "string",
+                    "description": "Parent database or page ID"
+                },
+                "parent_type": {
+                    "type": "string",
+                    "description": "'database_id' or 'page_id' (default: 'database_id')",
+                    "default": "database_id"
+                },
+                "title": {
+                    "type": "string",
+                    "description": "Page title (default: 'Untitled')",
+                    "default": "Untitled"
+                },
+                "properties": {
+                    "type": "object",
+                    "description": "Page properties object (Notion API format) (optional)"
+                }
+            },
+            "required": ["parent_id"]
+        }
+    },
+    {
+        "name": "update_page",
+        "description": "Update page properties",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "page_id": {
+                    "type": "string",
+                    "description": "Page ID to update"
+                },
+                "properties": {
+                    "type": "object",
+                    "description": "Properties object to update (Notion API format)"
+                }
+            },
+            "required": ["page_id", "properties"]
+        }
+    },
+    # Block/Content tools
+    {
+        "name": "get_page_content",
+        "description": "Get all blocks (content) from a page",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "page_id": {
+                    "type": "string",
+                    "description": "Page ID"
+                }
+            },
+            "required": ["page_id"]
+        }
+    },
+    {
+        "name": "append_blocks",
+        "description": "Append blocks (content) to a page",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "page_id": {
+                    "type": "string",
+                    "description": "Page ID to append to"
+                },
+                "blocks": {
+                    "type": "array",
+                    "description": "Array of block objects (Notion API format)"
+                }
+            },
+            "required": ["page_id", "blocks"]
+        }
+    },
+    # Search tools
+    {
+        "name": "search",
+        "description": "Search across Notion workspace",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query"
+                },
+                "filter_type": {
+                    "type": "string",
+                    "description": "Filter by type: 'page' or 'database' (optional)"
+                },
+                "max_results": {
+                    "type": "number",
+                    "description": "Maximum results (default: 20)",
+                    "default": 20
+                }
+            },
+            "required": ["query"]
+        }
+    },
+    # User tools
+    {
+        "name": "list_users",
+        "description": "List all users in workspace",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "max_results": {
+                    "type": "number",
+                    "description": "Maximum results (default: 20)",
+                    "default": 20
+                }
+            },
+            "required": []
+        }
+    },
+    # Batch tool
+    {
+        "name": "batch",
+        "description": "Run several Notion tools concurrently in one request; results are returned in input order",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "description": "Tool calls to run, each as {\"name\": ..., \"arguments\": {...}}",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "arguments": {"type": "object"}
+                        },
+                        "required": ["name"]
+                    }
+                }
+            },
+            "required": ["calls"]
+        }
+    }
+]
+
+# call_tool honours "pretty" for every tool, so every schema declares it
+for _tool in TOOLS:
+    _tool["inputSchema"]["properties"]["pretty"] = {
+        "type": "boolean",
+        "description": "Indent the JSON output (default: false)",
+        "default": False
+    }
+
 @app.list_resources()
 async def list_resources() -> list[dict[str, Any]]:
     """List available Notion resources"""
-    return [
-        {
-            "uri": "notion://databases",
-            "name": "Databases",
-            "description": "All accessible databases",
-            "mimeType": "application/json"
-        },
-        {
-            "uri": "notion://search/recent",
-            "name": "Recent Pages",
-            "description": "Recently edited pages",
-            "mimeType": "application/json"
-        }
-    ]
+    return RESOURCES
 
 @app.read_resource()
 async def read_resource(uri: str) -> str:
     """Read a Notion resource"""
     if uri == "notion://databases":
-        databases = list_databases()
-        return json.dumps(databases, indent=2)
+        databases = await list_databases()
+        return _dumps(databases)
 
     elif uri == "notion://search/recent":
-        results = search_notion("", max_results=20)
-        return json.dumps(results, indent=2)
+        results = await search_notion("", max_results=20)
+        return _dumps(results)
 
     raise ValueError(f"Unknown resource: {uri}")
 
 @app.list_tools()
 async def list_tools() -> list[dict[str, Any]]:
     """List available Notion tools"""
-    return [
-        # Database tools
-        {
-            "name": "list_databases",
-            "description": "List all accessible databases in workspace",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "max_results": {
-                        "type": "number",
-                        "description": "Maximum results (default: 20)",
-                        "default": 20
-                    }
-                },
-                "required": []
-            }
-        },
-        {
-            "name": "query_database",
-            "description": "Query a database with optional filters and sorts",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "database_id": {
-                        "type": "string",
-                        "description": "Database ID"
-                    },
-                    "filter": {
-                        "type": "object",
-                        "description": "Filter object (Notion API format) (optional)"
-                    },
-                    "sorts": {
-                        "type": "array",
-                        "description": "Sort array (Notion API format) (optional)"
-                    },
-                    "max_results": {
-                        "type": "number",
-                        "description": "Maximum results (default: 20)",
-                        "default": 20
-                    }
-                },
-                "required": ["database_id"]
-            }
-        },
-        # Page tools
-        {
-            "name": "get_page",
-            "description": "Get page details and properties",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "page_id": {
-                        "type": "string",
-                        "description": "Page ID"
-                    }
-                },
-                "required": ["page_id"]
-            }
-        },
-        {
-            "name": "create_page",
-            "description": "Create a new page in a database or as child of another page",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "parent_id": {
-                        "type": "string",
-                        "description": "Parent database or page ID"
-                    },
-                    "parent_type": {
-                        "type": "string",
-                        "description": "'database_id' or 'page_id' (default: 'database_id')",
-                        "default": "database_id"
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "Page title (default: 'Untitled')",
-                        "default": "Untitled"
-                    },
-                    "properties": {
-                        "type": "object",
-                        "description": "Page properties object (Notion API format) (optional)"
-                    }
-                },
-                "required": ["parent_id"]
-            }
-        },
-        {
-            "name": "update_page",
-            "description": "Update page properties",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "page_id": {
-                        "type": "string",
-                        "description": "Page ID to update"
-                    },
-                    "properties": {
-                        "type": "object",
-                        "description": "Properties object to update (Notion API format)"
-                    }
-                },
-                "required": ["page_id", "properties"]
-            }
-        },
-        # Block/Content tools
-        {
-            "name": "get_page_content",
-            "description": "Get all blocks (content) from a page",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "page_id": {
-                        "type": "string",
-                        "description": "Page ID"
-                    }
-                },
-                "required": ["page_id"]
-            }
-        },
-        {
-            "name": "append_blocks",
-            "description": "Append blocks (content) to a page",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "page_id": {
-                        "type": "string",
-                        "description": "Page ID to append to"
-                    },
-                    "blocks": {
-                        "type": "array",
-                        "description": "Array of block objects (Notion API format)"
-                    }
-                },
-                "required": ["page_id", "blocks"]
-            }
-        },
-        # Search tools
-        {
-            "name": "search",
-            "description": "Search across Notion workspace",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query"
-                    },
-                    "filter_type": {
-                        "type": "string",
-                        "description": "Filter by type: 'page' or 'database' (optional)"
-                    },
-                    "max_results": {
-                        "type": "number",
-                        "description": "Maximum results (default: 20)",
-                        "default": 20
-                    }
-                },
-                "required": ["query"]
-            }
-        },
-        # User tools
-        {
-            "name": "list_users",
-            "description": "List all users in workspace",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "max_results": {
-                        "type": "number",
-                        "description": "Maximum results (default: 20)",
-                        "default": 20
-                    }
-                },
-                "required": []
-            }
-        }
-    ]
-
-@app.call_tool()
-async def call_tool(name: str, arguments: dict) -> list[dict[str, Any]]:
-    """Execute a Notion tool"""
+    return TOOLS
 
+# Tool name -> handler taking the tool arguments
+TOOL_HANDLERS: dict[str, Callable[[dict], Awaitable[Any]]] = {
     # Database tools
-    if name == "list_databases":
-        result = list_databases(arguments.get("max_results", 20))
-        return [{"type": "text", "text": json.dumps(result, indent=2)}]
-
-    elif name == "query_database":
-        result = query_database(
-            database_id=arguments["database_id"],
-            filter_obj=arguments.get("filter"),
-            sorts=arguments.get("sorts"),
-            max_results=arguments.get("max_results", 20)
-        )
-        return [{"type": "text", "text": json.dumps(result, indent=2)}]
-
+    "list_databases": lambda args: list_databases(args.get("max_results", 20)),
+    "query_database": lambda args: query_database(
+        database_id=args["database_id"],
+        filter_obj=args.get("filter"),
+        sorts=args.get("sorts"),
+        max_results=args.get("max_results", 20)
+    ),
     # Page tools
-    elif name == "get_page":
-        result = get_page(arguments["page_id"])
-        return [{"type": "text", "text": json.dumps(result, indent=2)}]
-
-    elif name == "create_page":
-        result = create_page(
-            parent_id=arguments["parent_id"],
-            parent_type=arguments.get("parent_type", "database_id"),
-            title=arguments.get("title", "Untitled"),
-            properties=arguments.get("properties")
-        )
-        return [{"type": "text", "text": json.dumps(result, indent=2)}]
-
-    elif name == "update_page":
-        result = update_page(
-            page_id=arguments["page_id"],
-            properties=arguments["properties"]
-        )
-        return [{"type": "text", "text": json.dumps(result, indent=2)}]
-
+    "get_page": lambda args: get_page(args["page_id"]),
+    "create_page": lambda args: create_page(
+        parent_id=args["parent_id"],
+        parent_type=args.get("parent_type", "database_id"),
+        title=args.get("title", "Untitled"),
+        properties=args.get("properties")
+    ),
+    "update_page": lambda args: update_page(
+        page_id=args["page_id"],
+        properties=args["properties"]
+    ),
     # Block/Content tools
-    elif name == "get_page_content":
-        result = get_page_content(arguments["page_id"])
-        return [{"type": "text", "text": json.dumps(result, indent=2)}]
-
-    elif name == "append_blocks":
-        result = append_block_children(
-            page_id=arguments["page_id"],
-            blocks=arguments["blocks"]
-        )
-        return [{"type": "text", "text": json.dumps(result, indent=2)}]
-
+    "get_page_content": lambda args: get_page_content(args["page_id"]),
+    "append_blocks": lambda args: append_block_children(
+        page_id=args["page_id"],
+        blocks=args["blocks"]
+    ),
     # Search tools
-    elif name == "search":
-        result = search_notion(
-            query=arguments["query"],
-            filter_type=arguments.get("filter_type"),
-            max_results=arguments.get("max_results", 20)
-        )
-        return [{"type": "text", "text": json.dumps(result, indent=2)}]
-
+    "search": lambda args: search_notion(
+        query=args["query"],
+        filter_type=args.get("filter_type"),
+        max_results=args.get("max_results", 20)
+    ),
     # User tools
-    elif name == "list_users":
-        result = list_users(arguments.get("max_results", 20))
-        return [{"type": "text", "text": json.dumps(result, indent=2)}]
+    "list_users": lambda args: list_users(args.get("max_results", 20)),
+}
+
+async def dispatch(name: str, arguments: dict) -> Any:
+    """Run a single Notion tool and return its raw result"""
+    handler = TOOL_HANDLERS.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+
+    return await handler(arguments)
+
+async def _run_batch(calls: list[dict]) -> list[dict]:
+    """Run several tool calls concurrently, returning results in input order"""
+    async def run_one(call: dict) -> dict:
+        name = call.get("name")
+        if name == "batch":
+            return {"name": name, "error": "Nested batch calls are not supported"}
+        try:
+            return {"name": name, "result": await dispatch(name, call.get("arguments", {}))}
+        except Exception as e:
+            return {"name": name, "error": str(e)}
+
+    return await asyncio.gather(*(run_one(call) for call in calls))
 
-    raise ValueError(f"Unknown tool: {name}")
+@app.call_tool()
+async def call_tool(name: str, arguments: dict) -> list[dict[str, Any]]:
+    """Execute a Notion tool"""
+    if name == "batch":
+        result = await _run_batch(arguments["calls"])
+    else:
+        result = await dispatch(name, arguments)
+    return _text_result(_dumps(result, pretty=arguments.get("pretty", False)))
 
 # ============================================================================
 # Main Entry Point
@@ -596,9 +787,9 @@ def main():
     print(f"Token: {NOTION_TOKEN[:8]}..." if NOTION_TOKEN else "No token")
 
     try:
-        # Test connection
-        notion.users.me()
-        print("✓ Connected to Notion API")
+        # Test connection; this also opens the pooled connection for the first tool call
+        bot_user = notion.users.me()
+        print(f"✓ Connected to Notion API as {bot_user.get('name', 'integration')}")
         print("Server is ready for connections...")
 
         # Run the server
@@ -7,16 +7,72 @@ and data extraction.
 """
 
 import asyncio
+import functools
+import itertools
 import json
 import logging
-from datetime import datetime, timedelta
+import re
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, List, Optional, Any
 
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page, TimeoutError as PlaywrightTimeoutError
 
 logger = logging.getLogger(__name__)
 
+INBOX_URL = "https://outlook.office.com/mail/inbox"
+CALENDAR_DAY_URL = "https://outlook.office.com/calendar/view/day"
+CALENDAR_WEEK_URL = "https://outlook.office.com/calendar/view/week"
+
+# Selectors shared across calls; keeping the strings stable lets Playwright
+# reuse its parsed form instead of re-parsing per call
+MAIL_UI_SELECTORS = (
+    '[aria-label*="Folder list"]',
+    '[aria-label*="Message list"]',
+    '[data-app-section="MailCompose"]',
+)
+MAIL_UI_SELECTOR = ", ".join(MAIL_UI_SELECTORS)
+LOGGED_IN_SELECTORS = MAIL_UI_SELECTORS + ('div[role="main"]',)
+SESSION_READY_SELECTOR = ", ".join(MAIL_UI_SELECTORS + ('a:has-text("Sign in")', 'input[type="email"]'))
+MESSAGE_LIST_SELECTOR = '[role="listbox"], [role="list"]'
+LIST_ITEM_SELECTOR = '[role="listitem"]'
+UNREAD_ITEM_SELECTOR = '[role="listitem"][aria-label*="Unread"]'
+READING_PANE_SELECTOR = '[role="article"], [data-testid*="subject"]'
+SEARCH_BOX_SELECTOR = '[aria-label*="Search"], [placeholder*="Search"]'
+CALENDAR_SELECTOR = '[role="main"], [data-app-section="Calendar"]'
+EVENT_ITEM_SELECTOR = '[role="button"][aria-label*="event"], [data-is-focusable="true"][aria-label*=","]'
+
+# Items render right behind their list or calendar; once the container is up,
+# none appearing within this many milliseconds means the view is empty
+ITEMS_SETTLE_TIMEOUT = 1000
+
+# Images, fonts and telemetry add load time but nothing that is scraped
+BLOCKED_REQUESTS = re.compile(
+    r"\.(?:png|jpe?g|gif|webp|ico|woff2?|ttf)(?:\?|$)"
+    r"|browser\.events\.data\.microsoft\.com|clarity\.ms|google-analytics\.com"
+)
+
+# Message list aria-labels read "Unread, From: X, Subject: Y, Received: Z";
+# one scan picks out every field, each ending at the next ", "
+ARIA_FIELD_RE = re.compile(r"(From|Subject|Received):\s*(.*?)(?=, |$)")
+ARIA_FIELDS = {"From": "sender", "Subject": "subject", "Received": "date"}
+
+# Collects aria-label and text for the first `limit` (default: all) matched
+# elements in a single evaluate call, for use with Locator.evaluate_all()
+LIST_ITEMS_JS = """(elements, limit) => elements.slice(0, limit ?? elements.length).map(e => ({
+    aria: e.getAttribute("aria-label") || "",
+    text: e.innerText || ""
+}))"""
+
+# Reads the open message's subject, sender and body in a single evaluate call
+READING_PANE_JS = """() => {
+    const text = (selector) => document.querySelector(selector)?.innerText || "";
+    return {
+        subject: text('[data-testid*="subject"], [role="heading"]'),
+        sender: text('[aria-label*="From:"], .ms-font-m'),
+        body: text('[role="article"], .ms-font-m[dir="auto"]')
+    };
+}"""
+
 
 class OutlookSessionError(Exception):
     """Raised when session is invalid or expired."""
@@ -28,6 +84,15 @@ class OutlookLoginRequiredError(OutlookSessionError):
     pass
 
 
+def _serialized(method):
+    """Run a coroutine method while holding the client's lock."""
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        async with self._lock:
+            return await method(self, *args, **kwargs)
+    return wrapper
+
+
 class OutlookWebClient:
     """
     Async Playwright-based client for automating Outlook.com.
@@ -38,7 +103,9 @@ class OutlookWebClient:
     Attributes:
         session_dir: Directory to store session state
         headless: Whether to run browser in headless mode
-        timeout: Default timeout in milliseconds
+        timeout: Timeout for login steps in milliseconds
+        navigation_timeout: Timeout for page loads in milliseconds
+        action_timeout: Timeout for in-page actions and waits in milliseconds
     """
 
     def __init__(
@@ -47,7 +114,9 @@ class OutlookWebClient:
         password: str,
         session_dir: str = "/app/session",
         headless: bool = True,
-        timeout: int = 30000
+        timeout: int = 30000,
+        navigation_timeout: int = 10000,
+        action_timeout: int = 5000
     ) -> None:
         """
         Initialize the Outlook web client.
@@ -57,7 +126,9 @@ class OutlookWebClient:
             password: Outlook password
             session_dir: Directory to store session state (default: /app/session)
             headless: Whether to run browser in headless mode (default: True)
-            timeout: Default timeout in milliseconds (default: 30000)
+            timeout: Timeout for login steps, which may wait on MFA (default: 30000)
+            navigation_timeout: Timeout for page loads (default: 10000)
+            action_timeout: Timeout for in-page actions and waits (default: 5000)
         """
         self.email = email
         self.password = password
@@ -66,6 +137,8 @@ class OutlookWebClient:
         self.session_file = self.session_dir / "outlook_state.json"
         self.headless = headless
         self.timeout = timeout
+        self.navigation_timeout = navigation_timeout
+        self.action_timeout = action_timeout
 
         self.playwright = None
         self.browser: Optional[Browser] = None
@@ -73,8 +146,22 @@ class OutlookWebClient:
         self.page: Optional[Page] = None
         self._logged_in = False
 
+        # Tools share one browser and page; public methods that start the
+        # browser or drive the page hold this lock for their duration
+        self._lock = asyncio.Lock()
+
+        # Unique suffixes for scraped email and event IDs
+        self._ids = itertools.count(1)
+
+        # View last navigated to with _ensure_at()
+        self._view: Optional[str] = None
+
+        # Locators for the current page, built once in _open_page()
+        self._unread_items = None
+        self._first_list_item = None
+
     async def _start_browser(self) -> None:
-        """Start the Playwright browser and context."""
+        """Start the Playwright browser and context. Callers hold self._lock."""
         if self.playwright is None:
             self.playwright = await async_playwright().start()
 
@@ -89,6 +176,40 @@ class OutlookWebClient:
                 ]
             )
 
+    async def _new_context(self, **kwargs: Any) -> None:
+        """Create the browser context, skipping requests that scraping never needs."""
+        self.context = await self.browser.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent='Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            **kwargs
+        )
+        await self.context.route(BLOCKED_REQUESTS, lambda route: route.abort())
+
+    async def _open_page(self) -> None:
+        """Open a page in the current context and bind its reusable locators."""
+        self.page = await self.context.new_page()
+        # Fail fast by default; only login opts into the long timeout
+        self.page.set_default_timeout(self.action_timeout)
+        self.page.set_default_navigation_timeout(self.navigation_timeout)
+        self._view = None
+
+        self._unread_items = self.page.locator(UNREAD_ITEM_SELECTOR)
+        self._first_list_item = self.page.locator(LIST_ITEM_SELECTOR).first
+
+    async def _ensure_at(self, url: str, reload: bool = False) -> None:
+        """
+        Navigate to a view unless the page is already showing it.
+
+        Outlook routes internally, so a repeated goto reloads the whole app.
+        Pass reload=True when state left over from an earlier call would
+        be mistaken for fresh content.
+        """
+        if not reload and self._view == url and self.page.url.startswith(url):
+            return
+        await self.page.goto(url, wait_until="domcontentloaded")
+        self._view = url
+
+    @_serialized
     async def load_session(self) -> bool:
         """
         Load saved browser session if it exists.
@@ -96,6 +217,10 @@ class OutlookWebClient:
         Returns:
             True if session loaded successfully, False otherwise
         """
+        return await self._load_session()
+
+    async def _load_session(self) -> bool:
+        """Load the saved session; see load_session(). Callers hold self._lock."""
         if not self.session_file.exists():
             logger.info("No saved session found")
             return False
@@ -105,18 +230,18 @@ class OutlookWebClient:
             await self._start_browser()
 
             # Load the saved context state
-            self.context = await self.browser.new_context(
-                storage_state=str(self.session_file),
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            self.page = await self.context.new_page()
-            self.page.set_default_timeout(self.timeout)
+            await self._new_context(storage_state=str(self.session_file))
+            await self._open_page()
 
             # Verify session is valid by navigating to Outlook
             logger.info("Verifying session validity")
             await self.page.goto("https://outlook.office.com/mail/", wait_until="domcontentloaded")
-            await self.page.wait_for_timeout(3000)
+
+            # Continue as soon as either the mail UI or a sign-in prompt renders
+            try:
+                await self.page.wait_for_selector(SESSION_READY_SELECTOR, timeout=self.navigation_timeout)
+            except PlaywrightTimeoutError:
+                logger.warning("Outlook did not finish loading while verifying session")
 
             # Check if we're logged in by looking for mail interface
             if await self._is_logged_in():
@@ -146,22 +271,11 @@ class OutlookWebClient:
 
             # Check for common Outlook UI elements
             # Look for mail folder list or inbox
-            selectors = [
-                '[aria-label*="Folder list"]',
-                '[aria-label*="Message list"]',
-                '[data-app-section="MailCompose"]',
-                'div[role="main"]'
-            ]
-
-            for selector in selectors:
-                if await self.page.locator(selector).count() > 0:
-                    return True
-
-            # If we see login button, definitely not logged in
-            if await self.page.locator('a:has-text("Sign in")').count() > 0:
-                return False
-
-            return False
+            # Probe every selector at once instead of one round trip each
+            counts = await asyncio.gather(
+                *(self.page.locator(selector).count() for selector in LOGGED_IN_SELECTORS)
+            )
+            return any(count > 0 for count in counts)
 
         except Exception as e:
             logger.error(f"Error checking login status: {e}")
@@ -189,6 +303,7 @@ class OutlookWebClient:
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
 
+    @_serialized
     async def login(self) -> bool:
         """
         Perform headless login and save session.
@@ -207,34 +322,28 @@ class OutlookWebClient:
             await self._start_browser()
 
             # Create new context for login
-            self.context = await self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            self.page = await self.context.new_page()
-            self.page.set_default_timeout(self.timeout)
+            await self._new_context()
+            await self._open_page()
 
             # Navigate to Outlook login
             logger.info("Navigating to Outlook login page")
-            await self.page.goto("https://outlook.office.com/mail/")
-            await self.page.wait_for_timeout(2000)
+            await self.page.goto("https://outlook.office.com/mail/", timeout=self.timeout)
 
             # Fill email
             logger.info("Entering email")
             email_input = self.page.locator('input[type="email"], input[name="loginfmt"], input[placeholder*="email"]').first
+            await email_input.wait_for(state="visible", timeout=self.timeout)
             await email_input.fill(self.email)
-            await self.page.wait_for_timeout(500)
 
             # Click Next
             next_button = self.page.locator('button:has-text("Next"), input[type="submit"]').first
             await next_button.click()
-            await self.page.wait_for_timeout(2000)
 
             # Fill password
             logger.info("Entering password")
             password_input = self.page.locator('input[type="password"], input[name="passwd"]').first
+            await password_input.wait_for(state="visible", timeout=self.timeout)
             await password_input.fill(self.password)
-            await self.page.wait_for_timeout(500)
 
             # Click Sign in
             signin_button = self.page.locator('button:has-text("Sign in"), input[type="submit"]').first
@@ -243,10 +352,7 @@ class OutlookWebClient:
             # Wait for mail interface or handle MFA
             logger.info("Waiting for login completion")
             try:
-                await self.page.wait_for_selector(
-                    '[aria-label*="Folder list"], [aria-label*="Message list"], [data-app-section="MailCompose"]',
-                    timeout=30000
-                )
+                await self.page.wait_for_selector(MAIL_UI_SELECTOR, timeout=self.timeout)
             except PlaywrightTimeoutError:
                 logger.error("Login timeout - may require manual MFA completion")
                 return False
@@ -263,6 +369,8 @@ class OutlookWebClient:
 
         except Exception as e:
             logger.error(f"Login error: {e}")
+            # Don't leave a half-initialised context behind
+            await self._cleanup_context()
             raise OutlookSessionError(f"Failed to login: {str(e)}")
 
     async def is_session_valid(self) -> bool:
@@ -277,82 +385,99 @@ class OutlookWebClient:
 
         return await self.load_session()
 
-    async def get_unread_emails(self, limit: int = 20) -> List[Dict[str, Any]]:
+    async def _ensure_session(self) -> None:
         """
-        Get list of unread emails from inbox.
+        Make sure a valid session is loaded. Callers hold self._lock.
+
+        Raises:
+            OutlookLoginRequiredError: If no valid session exists
+        """
+        if not (self._logged_in or await self._load_session()):
+            raise OutlookLoginRequiredError(
+                "No valid session found. Please call login() first."
+            )
+
+    async def iter_unread_emails(self, limit: int = 20) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield unread emails from the inbox one at a time.
+
+        The message list is read in a single round trip; items are parsed as
+        they are consumed, so callers that stop early skip the rest.
 
         Args:
-            limit: Maximum number of emails to return
+            limit: Maximum number of emails to yield
 
-        Returns:
-            List of email dictionaries with id, subject, sender, date
+        Yields:
+            Email dictionaries with id, subject, sender, date
         """
-        try:
-            if not await self.is_session_valid():
-                raise OutlookLoginRequiredError(
-                    "No valid session found. Please call login() first."
-                )
+        # Hold the lock only while driving the page, never across a yield
+        async with self._lock:
+            await self._ensure_session()
 
             logger.info(f"Fetching up to {limit} unread emails")
 
             # Navigate to inbox if not already there
-            await self.page.goto("https://outlook.office.com/mail/inbox", wait_until="domcontentloaded")
-            await self.page.wait_for_timeout(2000)
+            await self._ensure_at(INBOX_URL)
 
-            # Wait for message list to load
+            # A list that never loads is an error, not an empty inbox
+            await self.page.wait_for_selector(MESSAGE_LIST_SELECTOR, timeout=self.navigation_timeout)
             try:
-                await self.page.wait_for_selector('[role="listbox"], [role="list"]', timeout=10000)
+                await self.page.wait_for_selector(UNREAD_ITEM_SELECTOR, timeout=ITEMS_SETTLE_TIMEOUT)
             except PlaywrightTimeoutError:
-                logger.warning("Message list did not load in time")
-                return []
-
-            emails = []
+                logger.info("No unread emails found")
+                return
 
             # Find unread messages
             # Outlook marks unread with specific attributes
-            message_items = await self.page.locator('[role="listitem"][aria-label*="Unread"]').all()
-            message_items = message_items[:limit]
+            # Read every label and text in one round trip instead of one or two per item
+            message_items = await self._unread_items.evaluate_all(LIST_ITEMS_JS, limit)
 
-            for idx, item in enumerate(message_items):
-                try:
-                    # Extract email data from the list item
-                    aria_label = await item.get_attribute("aria-label") or ""
+        for idx, item in enumerate(message_items):
+            try:
+                # Extract email data from the list item
+                aria_label = item["aria"]
+
+                # Try to extract structured data
+                email_data = {
+                    "id": f"email_{next(self._ids)}",
+                    "subject": "",
+                    "sender": "",
+                    "preview": "",
+                    "date": "",
+                    "unread": True
+                }
+
+                # Parse aria-label which often contains: "Unread, From: X, Subject: Y, Received: Z"
+                for label, value in ARIA_FIELD_RE.findall(aria_label):
+                    email_data[ARIA_FIELDS[label]] = value.strip()
+
+                # If aria-label parsing didn't work, try text content
+                if not email_data["subject"]:
+                    lines = item["text"].split("\n")
+                    if len(lines) >= 2:
+                        email_data["sender"] = lines[0]
+                        email_data["subject"] = lines[1]
+                        if len(lines) > 2:
+                            email_data["preview"] = lines[2]
 
-                    # Try to extract structured data
-                    email_data = {
-                        "id": f"email_{idx}_{datetime.now().timestamp()}",
-                        "subject": "",
-                        "sender": "",
-                        "preview": "",
-                        "date": "",
-                        "unread": True
-                    }
+            except Exception as e:
+                logger.warning(f"Failed to parse email item {idx}: {e}")
+                continue
 
-                    # Parse aria-label which often contains: "Unread, From: X, Subject: Y, Received: Z"
-                    parts = aria_label.split(", ")
-                    for part in parts:
-                        if part.startswith("From:"):
-                            email_data["sender"] = part.replace("From:", "").strip()
-                        elif part.startswith("Subject:"):
-                            email_data["subject"] = part.replace("Subject:", "").strip()
-                        elif "Received:" in part:
-                            email_data["date"] = part.split("Received:")[-1].strip()
-
-                    # If aria-label parsing didn't work, try text content
-                    if not email_data["subject"]:
-                        text = await item.inner_text()
-                        lines = text.split("\n")
-                        if len(lines) >= 2:
-                            email_data["sender"] = lines[0]
-                            email_data["subject"] = lines[1]
-                            if len(lines) > 2:
-                                email_data["preview"] = lines[2]
+            yield email_data
 
-                    emails.append(email_data)
+    async def get_unread_emails(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Get list of unread emails from inbox.
 
-                except Exception as e:
-                    logger.warning(f"Failed to parse email item {idx}: {e}")
-                    continue
+        Args:
+            limit: Maximum number of emails to return
+
+        Returns:
+            List of email dictionaries with id, subject, sender, date
+        """
+        try:
+            emails = [email_data async for email_data in self.iter_unread_emails(limit)]
 
             logger.info(f"Retrieved {len(emails)} unread emails")
             return emails
@@ -363,6 +488,7 @@ class OutlookWebClient:
             logger.error(f"Failed to get unread emails: {e}")
             raise Exception(f"Failed to retrieve unread emails: {str(e)}")
 
+    @_serialized
     async def get_email_content(self, email_id: str) -> Dict[str, Any]:
         """
         Get full email content by email ID.
@@ -377,29 +503,31 @@ class OutlookWebClient:
             Dictionary with full email content including body
         """
         try:
-            if not await self.is_session_valid():
-                raise OutlookLoginRequiredError(
-                    "No valid session found. Please call login() first."
-                )
+            await self._ensure_session()
 
             logger.info(f"Reading email: {email_id}")
 
-            # Navigate to inbox
-            await self.page.goto("https://outlook.office.com/mail/inbox", wait_until="domcontentloaded")
-            await self.page.wait_for_timeout(2000)
+            # Reload the inbox so the reading pane from a previous call can't
+            # satisfy the wait below before the clicked message opens
+            await self._ensure_at(INBOX_URL, reload=True)
 
             # Get first email (simplified approach)
             # In production, you'd map email_id to actual email location
             try:
-                await self.page.wait_for_selector('[role="listitem"]', timeout=5000)
+                await self.page.wait_for_selector(LIST_ITEM_SELECTOR, timeout=self.navigation_timeout)
             except PlaywrightTimeoutError:
                 logger.warning("No emails found")
                 return {"id": email_id, "error": "No emails found"}
 
             # Click first email to open it
-            first_email = self.page.locator('[role="listitem"]').first
-            await first_email.click()
-            await self.page.wait_for_timeout(2000)
+            await self._first_list_item.click()
+
+            # Wait for the reading pane rather than a fixed delay
+            try:
+                await self.page.wait_for_selector(READING_PANE_SELECTOR, timeout=self.action_timeout)
+            except PlaywrightTimeoutError:
+                logger.warning("Reading pane did not render in time")
+                return {"id": email_id, "error": "Email did not open"}
 
             # Extract email content
             email_data = {
@@ -411,26 +539,8 @@ class OutlookWebClient:
                 "body": ""
             }
 
-            # Try to get subject from header
-            try:
-                subject_elem = self.page.locator('[data-testid*="subject"], [role="heading"]').first
-                email_data["subject"] = await subject_elem.inner_text()
-            except:
-                pass
-
-            # Try to get sender
-            try:
-                sender_elem = self.page.locator('[aria-label*="From:"], .ms-font-m').first
-                email_data["sender"] = await sender_elem.inner_text()
-            except:
-                pass
-
-            # Try to get body
-            try:
-                body_elem = self.page.locator('[role="article"], .ms-font-m[dir="auto"]').first
-                email_data["body"] = await body_elem.inner_text()
-            except:
-                pass
+            # Read subject, sender and body in one round trip; missing ones stay empty
+            email_data.update(await self.page.evaluate(READING_PANE_JS))
 
             logger.info(f"Retrieved email content for {email_id}")
             return email_data
@@ -441,7 +551,8 @@ class OutlookWebClient:
             logger.error(f"Failed to read email: {e}")
             raise Exception(f"Failed to read email: {str(e)}")
 
-    def search_emails(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+    @_serialized
+    async def search_emails(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
         """
         Search emails by query.
 
@@ -453,33 +564,47 @@ class OutlookWebClient:
             List of matching emails
         """
         try:
-            self._ensure_session()
+            await self._ensure_session()
             logger.info(f"Searching emails for: {query}")
 
             # Navigate to mail
-            self.page.goto("https://outlook.office.com/mail/inbox", wait_until="domcontentloaded")
-            self.page.wait_for_timeout(1000)
+            await self._ensure_at(INBOX_URL)
 
             # Find and use search box
-            search_box = self.page.locator('[aria-label*="Search"], [placeholder*="Search"]').first
-            search_box.click()
-            search_box.fill(query)
-            search_box.press("Enter")
+            search_box = self.page.locator(SEARCH_BOX_SELECTOR).first
+            await search_box.click()
+            await search_box.fill(query)
+
+            # Remember what the list shows now, so its items can't pass for results
+            stale_item = await self.page.query_selector(LIST_ITEM_SELECTOR)
+
+            # Wait for the search API to answer rather than a fixed delay
+            try:
+                async with self.page.expect_response(lambda r: "/search/api/" in r.url, timeout=self.navigation_timeout):
+                    await search_box.press("Enter")
+            except PlaywrightTimeoutError:
+                logger.warning("Search response not observed, waiting for the list to change")
 
-            # Wait for results
-            self.page.wait_for_timeout(3000)
+            # Results replace the message list in place
+            self._view = None
+            if stale_item is not None:
+                await stale_item.wait_for_element_state("hidden", timeout=self.navigation_timeout)
+            try:
+                await self.page.wait_for_selector(LIST_ITEM_SELECTOR, timeout=self.action_timeout)
+            except PlaywrightTimeoutError:
+                logger.info("No emails matched the search")
+                return []
 
             # Parse results (similar to unread emails)
             emails = []
-            message_items = self.page.locator('[role="listitem"]').all()[:limit]
+            message_items = await self.page.locator(LIST_ITEM_SELECTOR).evaluate_all(LIST_ITEMS_JS, limit)
 
             for idx, item in enumerate(message_items):
                 try:
-                    aria_label = item.get_attribute("aria-label") or ""
-                    text = item.inner_text()
+                    text = item["text"]
 
                     email_data = {
-                        "id": f"search_{idx}_{datetime.now().timestamp()}",
+                        "id": f"search_{next(self._ids)}",
                         "subject": "",
                         "sender": "",
                         "preview": text[:200] if text else "",
@@ -506,54 +631,109 @@ class OutlookWebClient:
             logger.error(f"Failed to search emails: {e}")
             raise Exception(f"Failed to search emails: {str(e)}")
 
-    def get_calendar_events_today(self) -> List[Dict[str, Any]]:
+    async def _calendar_labels(self, url: str, page: Optional[Page] = None) -> List[str]:
         """
-        Get today's calendar events.
+        Open a calendar view and return the aria-label of every event in it.
+
+        Args:
+            url: Calendar view URL
+            page: Page to load the view in (default: the client's main page)
 
         Returns:
-            List of event dictionaries
+            List of event aria-labels
         """
+        if page is None:
+            page = self.page
+            await self._ensure_at(url)
+        else:
+            await page.goto(url, wait_until="domcontentloaded")
+
+        # A calendar that never loads is an error, not an empty day
+        await page.wait_for_selector(CALENDAR_SELECTOR, timeout=self.navigation_timeout)
         try:
-            self._ensure_session()
-            logger.info("Fetching today's calendar events")
-
-            # Navigate to calendar
-            self.page.goto("https://outlook.office.com/calendar/view/day", wait_until="domcontentloaded")
-            self.page.wait_for_timeout(3000)
-
-            # Wait for calendar to load
-            self.page.wait_for_selector('[role="main"], [data-app-section="Calendar"]', timeout=10000)
+            await page.wait_for_selector(EVENT_ITEM_SELECTOR, timeout=ITEMS_SETTLE_TIMEOUT)
+        except PlaywrightTimeoutError:
+            logger.info(f"No calendar events found at {url}")
+            return []
+
+        # Find event elements
+        event_items = await page.locator(EVENT_ITEM_SELECTOR).evaluate_all(LIST_ITEMS_JS)
+        return [item["aria"] for item in event_items]
+
+    def _parse_day_events(self, labels: List[str]) -> List[Dict[str, Any]]:
+        """Build event dictionaries from day-view aria-labels."""
+        events = []
+        for idx, aria_label in enumerate(labels):
+            try:
+                event_data = {
+                    "id": f"event_{next(self._ids)}",
+                    "title": "",
+                    "time": "",
+                    "location": "",
+                    "details": aria_label
+                }
+
+                # Parse aria-label which often contains time and title
+                if "," in aria_label:
+                    parts = aria_label.split(",", 1)
+                    event_data["time"] = parts[0].strip()
+                    event_data["title"] = parts[1].strip() if len(parts) > 1 else ""
+                else:
+                    event_data["title"] = aria_label
+
+                events.append(event_data)
+
+            except Exception as e:
+                logger.warning(f"Failed to parse event {idx}: {e}")
+                continue
+
+        return events
+
+    def _parse_week_events(self, labels: List[str]) -> List[Dict[str, Any]]:
+        """Build event dictionaries from week-view aria-labels."""
+        events = []
+        for idx, aria_label in enumerate(labels):
+            try:
+                event_data = {
+                    "id": f"event_week_{next(self._ids)}",
+                    "title": "",
+                    "time": "",
+                    "location": "",
+                    "details": aria_label
+                }
+
+                # Parse event data
+                if "," in aria_label:
+                    parts = aria_label.split(",")
+                    if len(parts) >= 2:
+                        event_data["time"] = parts[0].strip()
+                        event_data["title"] = parts[1].strip()
+                        if len(parts) > 2:
+                            event_data["location"] = parts[2].strip()
+                else:
+                    event_data["title"] = aria_label
 
-            events = []
+                events.append(event_data)
 
-            # Find event elements
-            event_items = self.page.locator('[role="button"][aria-label*="event"], [data-is-focusable="true"][aria-label*=","]').all()
+            except Exception as e:
+                logger.warning(f"Failed to parse event {idx}: {e}")
+                continue
 
-            for idx, item in enumerate(event_items):
-                try:
-                    aria_label = item.get_attribute("aria-label") or ""
-
-                    event_data = {
-                        "id": f"event_{idx}_{datetime.now().timestamp()}",
-                        "title": "",
-                        "time": "",
-                        "location": "",
-                        "details": aria_label
-                    }
+        return events
 
-                    # Parse aria-label which often contains time and title
-                    if "," in aria_label:
-                        parts = aria_label.split(",", 1)
-                        event_data["time"] = parts[0].strip()
-                        event_data["title"] = parts[1].strip() if len(parts) > 1 else ""
-                    else:
-                        event_data["title"] = aria_label
+    @_serialized
+    async def get_calendar_events_today(self) -> List[Dict[str, Any]]:
+        """
+        Get today's calendar events.
 
-                    events.append(event_data)
+        Returns:
+            List of event dictionaries
+        """
+        try:
+            await self._ensure_session()
+            logger.info("Fetching today's calendar events")
 
-                except Exception as e:
-                    logger.warning(f"Failed to parse event {idx}: {e}")
-                    continue
+            events = self._parse_day_events(await self._calendar_labels(CALENDAR_DAY_URL))
 
             logger.info(f"Retrieved {len(events)} events for today")
             return events
@@ -564,7 +744,8 @@ class OutlookWebClient:
             logger.error(f"Failed to get calendar events: {e}")
             raise Exception(f"Failed to retrieve calendar events: {str(e)}")
 
-    def get_calendar_events_week(self) -> List[Dict[str, Any]]:
+    @_serialized
+    async def get_calendar_events_week(self) -> List[Dict[str, Any]]:
         """
         Get this week's calendar events.
 
@@ -572,51 +753,53 @@ class OutlookWebClient:
             List of event dictionaries
         """
         try:
-            self._ensure_session()
+            await self._ensure_session()
             logger.info("Fetching this week's calendar events")
 
-            # Navigate to calendar week view
-            self.page.goto("https://outlook.office.com/calendar/view/week", wait_until="domcontentloaded")
-            self.page.wait_for_timeout(3000)
+            events = self._parse_week_events(await self._calendar_labels(CALENDAR_WEEK_URL))
 
-            # Wait for calendar to load
-            self.page.wait_for_selector('[role="main"], [data-app-section="Calendar"]', timeout=10000)
+            logger.info(f"Retrieved {len(events)} events for the week")
+            return events
 
-            events = []
+        except OutlookLoginRequiredError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to get calendar events: {e}")
+            raise Exception(f"Failed to retrieve calendar events: {str(e)}")
 
-            # Find event elements
-            event_items = self.page.locator('[role="button"][aria-label*="event"], [data-is-focusable="true"][aria-label*=","]').all()
+    @_serialized
+    async def get_calendar_events_today_and_week(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get today's and this week's calendar events in one call.
 
-            for idx, item in enumerate(event_items):
-                try:
-                    aria_label = item.get_attribute("aria-label") or ""
-
-                    event_data = {
-                        "id": f"event_week_{idx}_{datetime.now().timestamp()}",
-                        "title": "",
-                        "time": "",
-                        "location": "",
-                        "details": aria_label
-                    }
+        The week view loads on a second page in the same context so both
+        views render concurrently. That page is closed afterwards and never
+        becomes the client's tracked view.
 
-                    # Parse event data
-                    if "," in aria_label:
-                        parts = aria_label.split(",")
-                        if len(parts) >= 2:
-                            event_data["time"] = parts[0].strip()
-                            event_data["title"] = parts[1].strip()
-                            if len(parts) > 2:
-                                event_data["location"] = parts[2].strip()
-                    else:
-                        event_data["title"] = aria_label
+        Returns:
+            Dictionary with "today" and "week" event lists
+        """
+        try:
+            await self._ensure_session()
+            logger.info("Fetching today's and this week's calendar events")
 
-                    events.append(event_data)
+            week_page = await self.context.new_page()
+            week_page.set_default_timeout(self.action_timeout)
+            week_page.set_default_navigation_timeout(self.navigation_timeout)
+            try:
+                day_labels, week_labels = await asyncio.gather(
+                    self._calendar_labels(CALENDAR_DAY_URL),
+                    self._calendar_labels(CALENDAR_WEEK_URL, week_page)
+                )
+            finally:
+                await week_page.close()
 
-                except Exception as e:
-                    logger.warning(f"Failed to parse event {idx}: {e}")
-                    continue
+            events = {
+                "today": self._parse_day_events(day_labels),
+                "week": self._parse_week_events(week_labels)
+            }
 
-            logger.info(f"Retrieved {len(events)} events for the week")
+            logger.info(f"Retrieved {len(events['today'])} events for today and {len(events['week'])} for the week")
             return events
 
         except OutlookLoginRequiredError:
@@ -625,24 +808,27 @@ class OutlookWebClient:
             logger.error(f"Failed to get calendar events: {e}")
             raise Exception(f"Failed to retrieve calendar events: {str(e)}")
 
-    def close(self) -> None:
+    @_serialized
+    async def close(self) -> None:
         """Clean up and close browser resources."""
         logger.info("Closing Outlook client")
         try:
-            self._cleanup_context()
+            await self._cleanup_context()
             if self.browser:
-                self.browser.close()
+                await self.browser.close()
                 self.browser = None
             if self.playwright:
-                self.playwright.stop()
+                await self.playwright.stop()
                 self.playwright = None
         except Exception as e:
             logger.error(f"Error during close: {e}")
+        finally:
+            self._logged_in = False
 
-    def __enter__(self):
-        """Context manager entry."""
+    async def __aenter__(self):
+        """Async context manager entry."""
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        self.close()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
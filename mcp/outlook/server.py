@@ -32,6 +32,8 @@ mcp = FastMCP("Outlook MCP Server")
 SESSION_DIR = Path(os.getenv("OUTLOOK_SESSION_DIR", "/app/session"))
 HEADLESS = os.getenv("OUTLOOK_HEADLESS", "true").lower() == "true"
 TIMEOUT = int(os.getenv("OUTLOOK_TIMEOUT", "30000"))
+NAVIGATION_TIMEOUT = int(os.getenv("OUTLOOK_NAVIGATION_TIMEOUT", "10000"))
+ACTION_TIMEOUT = int(os.getenv("OUTLOOK_ACTION_TIMEOUT", "5000"))
 
 # Global client instance
 outlook_client: OutlookWebClient | None = None
@@ -54,7 +56,9 @@ def get_client() -> OutlookWebClient:
         outlook_client = OutlookWebClient(
             session_dir=SESSION_DIR,
             headless=HEADLESS,
-            timeout=TIMEOUT
+            timeout=TIMEOUT,
+            navigation_timeout=NAVIGATION_TIMEOUT,
+            action_timeout=ACTION_TIMEOUT
         )
 
     return outlook_client
@@ -124,7 +128,7 @@ def session_login() -> Dict[str, Any]:
 
 
 @mcp.tool()
-def email_list_unread(limit: int = 20) -> List[Dict[str, Any]]:
+async def email_list_unread(limit: int = 20) -> List[Dict[str, Any]]:
     """
     List unread emails from Outlook inbox.
 
@@ -151,7 +155,7 @@ def email_list_unread(limit: int = 20) -> List[Dict[str, Any]]:
         limit = max(1, min(limit, 50))
 
         client = get_client()
-        emails = client.get_unread_emails(limit=limit)
+        emails = await client.get_unread_emails(limit=limit)
 
         logger.info(f"Retrieved {len(emails)} unread emails")
         return emails
@@ -220,7 +224,7 @@ def email_read(email_id: str) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def email_search(query: str, limit: int = 20) -> List[Dict[str, Any]]:
+async def email_search(query: str, limit: int = 20) -> List[Dict[str, Any]]:
     """
     Search emails by query string.
 
@@ -253,7 +257,7 @@ def email_search(query: str, limit: int = 20) -> List[Dict[str, Any]]:
         limit = max(1, min(limit, 50))
 
         client = get_client()
-        results = client.search_emails(query=query.strip(), limit=limit)
+        results = await client.search_emails(query=query.strip(), limit=limit)
 
         logger.info(f"Search for '{query}' returned {len(results)} results")
         return results
@@ -276,7 +280,7 @@ def email_search(query: str, limit: int = 20) -> List[Dict[str, Any]]:
 
 
 @mcp.tool()
-def calendar_list_today() -> List[Dict[str, Any]]:
+async def calendar_list_today() -> List[Dict[str, Any]]:
     """
     List today's calendar events.
 
@@ -295,7 +299,7 @@ def calendar_list_today() -> List[Dict[str, Any]]:
     """
     try:
         client = get_client()
-        events = client.get_calendar_events_today()
+        events = await client.get_calendar_events_today()
 
         logger.info(f"Retrieved {len(events)} events for today")
         return events
@@ -317,7 +321,7 @@ def calendar_list_today() -> List[Dict[str, Any]]:
 
 
 @mcp.tool()
-def calendar_list_week() -> List[Dict[str, Any]]:
+async def calendar_list_week() -> List[Dict[str, Any]]:
     """
     List this week's calendar events.
 
@@ -337,7 +341,7 @@ def calendar_list_week() -> List[Dict[str, Any]]:
     """
     try:
         client = get_client()
-        events = client.get_calendar_events_week()
+        events = await client.get_calendar_events_week()
 
         logger.info(f"Retrieved {len(events)} events for the week")
         return events
@@ -358,6 +362,48 @@ def calendar_list_week() -> List[Dict[str, Any]]:
         }]
 
 
+@mcp.tool()
+async def calendar_list_today_and_week() -> Dict[str, Any]:
+    """
+    List today's and this week's calendar events together.
+
+    Loads the day and week views concurrently, which is faster than calling
+    calendar_list_today() and calendar_list_week() one after another.
+
+    Returns:
+        Dictionary containing:
+        - today: List - Today's events (same fields as calendar_list_today)
+        - week: List - This week's events (same fields as calendar_list_week)
+
+    Raises:
+        OutlookLoginRequiredError: If session is invalid or expired
+    """
+    try:
+        client = get_client()
+        events = await client.get_calendar_events_today_and_week()
+
+        logger.info(
+            f"Retrieved {len(events['today'])} events for today "
+            f"and {len(events['week'])} for the week"
+        )
+        return events
+
+    except OutlookLoginRequiredError as e:
+        logger.warning(f"Login required: {e}")
+        return {
+            "error": "login_required",
+            "message": str(e),
+            "action": "Call session_login() to authenticate"
+        }
+
+    except Exception as e:
+        logger.error(f"Error listing calendar events: {e}")
+        return {
+            "error": "fetch_failed",
+            "message": str(e)
+        }
+
+
 # Cleanup on shutdown
 @mcp.on_shutdown
 async def cleanup():
@@ -367,7 +413,7 @@ async def cleanup():
     if outlook_client:
         logger.info("Cleaning up Outlook client")
         try:
-            outlook_client.close()
+            await outlook_client.close()
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
         finally:
@@ -381,7 +427,7 @@ if __name__ == "__main__":
     logger.info("=" * 60)
     logger.info(f"Session directory: {SESSION_DIR}")
     logger.info(f"Headless mode: {HEADLESS}")
-    logger.info(f"Timeout: {TIMEOUT}ms")
+    logger.info(f"Timeout: {TIMEOUT}ms (navigation {NAVIGATION_TIMEOUT}ms, action {ACTION_TIMEOUT}ms)")
     logger.info("=" * 60)
 
     # Create session directory if it doesn't exist
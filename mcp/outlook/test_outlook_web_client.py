@@ -0,0 +1,131 @@
+"""Tests for OutlookWebClient calendar scraping"""
+
+import asyncio
+
+from outlook_web_client import (
+    CALENDAR_DAY_URL,
+    CALENDAR_SELECTOR,
+    CALENDAR_WEEK_URL,
+    EVENT_ITEM_SELECTOR,
+    OutlookWebClient,
+    PlaywrightTimeoutError,
+)
+
+
+class FakeLocator:
+    def __init__(self, page):
+        self.page = page
+
+    async def evaluate_all(self, script, limit=None):
+        await asyncio.sleep(0)
+        return [{"aria": label, "text": ""} for label in self.page.labels[self.page.url]]
+
+
+class FakePage:
+    """Page stub serving canned event labels per calendar view"""
+
+    def __init__(self, labels, fail_wait=False):
+        self.labels = labels
+        self.fail_wait = fail_wait
+        self.url = "about:blank"
+        self.closed = False
+        self.visits = []
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    def set_default_navigation_timeout(self, timeout):
+        pass
+
+    async def goto(self, url, **kwargs):
+        await asyncio.sleep(0)
+        self.url = url
+        self.visits.append(url)
+
+    async def wait_for_selector(self, selector, **kwargs):
+        assert selector in (CALENDAR_SELECTOR, EVENT_ITEM_SELECTOR)
+        if self.fail_wait:
+            raise RuntimeError("page crashed")
+        if selector == EVENT_ITEM_SELECTOR and not self.labels[self.url]:
+            raise PlaywrightTimeoutError("no events")
+
+    def locator(self, selector):
+        return FakeLocator(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self, page):
+        self.page = page
+
+    async def new_page(self):
+        return self.page
+
+
+LABELS = {
+    CALENDAR_DAY_URL: ["9:00 AM, Standup"],
+    CALENDAR_WEEK_URL: ["Mon 9:00 AM, Standup, Room 1", "Tue 2:00 PM, Review, Room 2"],
+}
+
+
+def _client(tmp_path, week_page):
+    client = OutlookWebClient("user@example.com", "secret", session_dir=str(tmp_path))
+    client._logged_in = True
+    client.page = FakePage(LABELS)
+    client.context = FakeContext(week_page)
+    return client
+
+
+def test_today_and_week_uses_a_separate_untracked_page(tmp_path):
+    week_page = FakePage(LABELS)
+    client = _client(tmp_path, week_page)
+
+    events = asyncio.run(client.get_calendar_events_today_and_week())
+
+    assert [e["title"] for e in events["today"]] == ["Standup"]
+    assert [e["location"] for e in events["week"]] == ["Room 1", "Room 2"]
+    assert client.page.visits == [CALENDAR_DAY_URL]
+    assert week_page.visits == [CALENDAR_WEEK_URL]
+    assert client._view == CALENDAR_DAY_URL
+    assert week_page.closed
+
+
+def test_today_and_week_with_no_events(tmp_path):
+    empty = {CALENDAR_DAY_URL: [], CALENDAR_WEEK_URL: []}
+    client = _client(tmp_path, FakePage(empty))
+    client.page = FakePage(empty)
+
+    events = asyncio.run(client.get_calendar_events_today_and_week())
+
+    assert events == {"today": [], "week": []}
+
+
+def test_today_and_week_closes_extra_page_on_failure(tmp_path):
+    week_page = FakePage(LABELS, fail_wait=True)
+    client = _client(tmp_path, week_page)
+
+    try:
+        asyncio.run(client.get_calendar_events_today_and_week())
+    except Exception as e:
+        assert "page crashed" in str(e)
+    else:
+        raise AssertionError("expected failure")
+    assert week_page.closed
+
+
+def test_today_and_week_is_serialized_with_other_tools(tmp_path):
+    client = _client(tmp_path, FakePage(LABELS))
+
+    async def run():
+        async with client._lock:
+            task = asyncio.ensure_future(client.get_calendar_events_today_and_week())
+            await asyncio.sleep(0.01)
+            # Blocked on the lock, so nothing has touched either page yet
+            assert not task.done()
+            assert client.page.visits == []
+        return await task
+
+    events = asyncio.run(run())
+    assert len(events["week"]) == 2